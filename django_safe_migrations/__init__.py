@@ -3,8 +3,13 @@
 Detect unsafe Django migrations before they break production.
 """
 
-from django_safe_migrations.analyzer import MigrationAnalyzer
-from django_safe_migrations.rules.base import Issue, Severity
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from django_safe_migrations.analyzer import MigrationAnalyzer
+    from django_safe_migrations.rules.base import Issue, Severity
 
 __version__ = "0.7.1"
 __all__ = [
@@ -15,3 +20,24 @@ __all__ = [
 ]
 
 default_app_config = "django_safe_migrations.apps.DjangoSafeMigrationsConfig"
+
+# Public names are imported on first access so that light entry points
+# (``django-safe-migrations --help``, ``__version__`` lookups) don't pay for
+# importing Django's migration framework and every rule module.
+_LAZY_ATTRS = {
+    "MigrationAnalyzer": "django_safe_migrations.analyzer",
+    "Issue": "django_safe_migrations.rules.base",
+    "Severity": "django_safe_migrations.rules.base",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily exported public names on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -4,16 +4,22 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import pickle  # nosec B403 - only used for PicklingError
 import sys
-from typing import TYPE_CHECKING, Any, Optional
+from collections import Counter, defaultdict
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, Optional
 
 from django_safe_migrations.conf import (
+    get_effective_rules_for_app,
     get_excluded_apps,
-    get_rule_severity_for_app,
+    get_severity_overrides_for_app,
     is_rule_enabled_for_app,
 )
 from django_safe_migrations.rules import get_all_rules
-from django_safe_migrations.rules.base import BaseRule, Issue
+from django_safe_migrations.rules.base import BaseRule, Issue, Severity
 from django_safe_migrations.suppression import (
     get_suppressions_for_migration,
     is_operation_suppressed,
@@ -30,6 +36,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("django_safe_migrations")
 
+# Below this many apps, process start-up costs more than analysing serially.
+_MIN_PARALLEL_APPS = 4
+
+# Per-process state for parallel analyze_all() workers; see _init_worker().
+_worker_analyzer: Optional[MigrationAnalyzer] = None
+
+
+def _init_worker(
+    rules: list[BaseRule],
+    db_vendor: str,
+    disabled_rules: Optional[Iterable[str]],
+    check_reverse: bool,
+    verbose: bool,
+) -> None:
+    """Prepare a worker process to analyse apps for analyze_all().
+
+    Forked workers inherit the parent's configured Django; spawned ones
+    (macOS/Windows, Python 3.14+ defaults) set it up from
+    ``DJANGO_SETTINGS_MODULE``. The worker's analyzer builds its migration
+    loader once and reuses it for every app it is given.
+    """
+    global _worker_analyzer
+
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+
+    _worker_analyzer = MigrationAnalyzer(
+        rules=rules,
+        db_vendor=db_vendor,
+        disabled_rules=disabled_rules,
+        verbose=verbose,
+        check_reverse=check_reverse,
+    )
+
+
+def _analyze_app_in_worker(app_label: str) -> list[Issue]:
+    """Analyse one app inside a worker process initialised by _init_worker()."""
+    assert _worker_analyzer is not None  # nosec B101 - set by _init_worker
+    return _worker_analyzer.analyze_app(app_label)
+
 
 class MigrationAnalyzer:
     """Analyzes Django migrations for unsafe operations.
@@ -57,10 +107,11 @@ class MigrationAnalyzer:
         self,
         rules: Optional[list[BaseRule]] = None,
         db_vendor: Optional[str] = None,
-        disabled_rules: Optional[list[str]] = None,
+        disabled_rules: Optional[Iterable[str]] = None,
         verbose: bool = False,
         cache: Optional[Any] = None,
         check_reverse: bool = False,
+        jobs: int = 1,
     ):
         """Initialize the analyzer.
 
@@ -69,24 +120,53 @@ class MigrationAnalyzer:
                    database vendor will be used.
             db_vendor: Database vendor (e.g., 'postgresql'). If None,
                        it will be detected from Django settings.
-            disabled_rules: List of rule IDs to disable. If None, uses
-                           SAFE_MIGRATIONS["DISABLED_RULES"] from settings.
+            disabled_rules: Rule IDs to disable. If None, uses the full
+                           configuration (DISABLED_RULES, categories and
+                           per-app APP_RULES) from settings.
             verbose: If True, print progress information to stderr.
             cache: Optional ``AnalysisCache``. When set, each migration's
                    issues are served from / stored to the cache keyed on a
                    dependency-aware content hash.
             check_reverse: If True, also analyse each migration's rollback
                    path for destructive operations (RV0xx issues).
+            jobs: Number of worker processes ``analyze_all`` may use to
+                   analyse apps in parallel. 1 (the default) analyses
+                   serially; 0 or less uses one worker per CPU. Parallelism
+                   is skipped when a cache is set or there are few apps.
         """
         self.db_vendor = db_vendor or get_db_vendor()
-        self._disabled_rules = disabled_rules
+        self._disabled_rules: Optional[frozenset[str]] = (
+            frozenset(disabled_rules) if disabled_rules is not None else None
+        )
+        # Choose the enablement check once: an explicit disabled_rules set is
+        # a plain membership test, otherwise the full configuration applies.
+        self._rule_enabled_check: Callable[[str, Optional[str]], bool] = (
+            self._is_enabled_by_disabled_set
+            if self._disabled_rules is not None
+            else is_rule_enabled_for_app
+        )
         self.verbose = verbose
         self.cache = cache
         self.check_reverse = check_reverse
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
         # Memoise per-file SHA-256 so each migration file is hashed once per run
         # even though it appears in many migrations' dependency closures.
         self._file_hash_memo: dict[str, str] = {}
+        # Migration loaders keyed by connection alias (None = no connection),
+        # built on first use and shared by every analyze_* call. See
+        # invalidate_loaders() / close().
+        self._loaders: dict[Optional[str], Any] = {}
         self.rules = rules or get_all_rules(self.db_vendor)
+        # Vendor / Django-version gating and enablement are fixed for the
+        # lifetime of the analyzer, so resolve them once instead of once per
+        # (operation, rule) pair. See invalidate_rule_cache().
+        self._applicable_rules: tuple[BaseRule, ...] = ()
+        self._active_rules_cache: dict[Optional[str], tuple[BaseRule, ...]] = {}
+        self._severity_cache: dict[Optional[str], dict[str, Severity]] = {}
+        self._operation_rules_cache: dict[
+            tuple[Optional[str], type], tuple[BaseRule, ...]
+        ] = {}
+        self.invalidate_rule_cache()
         logger.debug(
             "Initialized analyzer: db_vendor=%s, rules=%d, disabled_rules=%s",
             self.db_vendor,
@@ -107,11 +187,149 @@ class MigrationAnalyzer:
         Returns:
             True if the rule should run, False if it should be skipped.
         """
-        # If explicit disabled_rules list provided to constructor, use that
+        return self._rule_enabled_check(rule_id, app_label)
+
+    def _is_enabled_by_disabled_set(
+        self, rule_id: str, app_label: Optional[str] = None
+    ) -> bool:
+        """Return whether the rule is absent from the explicit disabled set."""
+        return rule_id not in self._disabled_rules  # type: ignore[operator]
+
+    def __enter__(self) -> MigrationAnalyzer:
+        """Return the analyzer for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release cached state when leaving the ``with`` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Drop the cached migration loaders and per-file hashes.
+
+        The analyzer remains usable; loaders are rebuilt on next use.
+        """
+        self.invalidate_loaders()
+        self._file_hash_memo.clear()
+
+    def invalidate_loaders(self) -> None:
+        """Forget cached migration loaders so the next analysis re-reads disk.
+
+        Call this if migration files change while the analyzer is alive.
+        """
+        self._loaders.clear()
+
+    def get_loader(self, connection: Any = None) -> Any:
+        """Return the shared MigrationLoader, building it on first use.
+
+        Callers that need the migration graph alongside an analysis should
+        use this rather than building their own loader. Call
+        invalidate_loaders() if migration files change on disk.
+
+        Args:
+            connection: Database connection for a loader that also knows
+                which migrations are applied. None builds a disk-only loader.
+
+        Returns:
+            A ``MigrationLoader`` reused across analyze_* calls.
+        """
+        from django.db.migrations.loader import MigrationLoader
+
+        key = None if connection is None else getattr(connection, "alias", "default")
+        loader = self._loaders.get(key)
+        if loader is None:
+            if connection is None:
+                loader = MigrationLoader(None, ignore_no_migrations=True)
+            else:
+                loader = MigrationLoader(connection)
+            self._loaders[key] = loader
+        return loader
+
+    def invalidate_rule_cache(self) -> None:
+        """Recompute the cached set of rules that apply to this run.
+
+        Call this after mutating ``self.rules`` or changing the
+        configuration at runtime; otherwise the active rules are resolved
+        once per analyzer (and once per app for enablement).
+        """
+        self._applicable_rules = tuple(
+            rule
+            for rule in self.rules
+            if rule.applies_to_db(self.db_vendor) and rule.applies_to_django()
+        )
+        self._active_rules_cache.clear()
+        self._severity_cache.clear()
+        self._operation_rules_cache.clear()
+
+    def _get_active_rules(self, app_label: Optional[str]) -> tuple[BaseRule, ...]:
+        """Return the rules that should run for ``app_label``.
+
+        Args:
+            app_label: The app being analyzed (per-app config may differ).
+
+        Returns:
+            The applicable rules that are enabled for the app.
+        """
+        active = self._active_rules_cache.get(app_label)
+        if active is None:
+            self._resolve_app_rules(app_label)
+            active = self._active_rules_cache[app_label]
+        return active
+
+    def _get_rules_for_operation(
+        self, app_label: Optional[str], operation_type: type
+    ) -> tuple[BaseRule, ...]:
+        """Return the active rules whose ``operation_types`` match.
+
+        Memoized per (app, concrete operation class); subclasses of a
+        declared operation type match, as with ``isinstance``.
+
+        Args:
+            app_label: The app being analyzed.
+            operation_type: The concrete class of the operation.
+
+        Returns:
+            The active rules that can flag this kind of operation.
+        """
+        key = (app_label, operation_type)
+        rules = self._operation_rules_cache.get(key)
+        if rules is None:
+            rules = tuple(
+                rule
+                for rule in self._get_active_rules(app_label)
+                if rule.operation_types is None
+                or issubclass(operation_type, rule.operation_types)
+            )
+            self._operation_rules_cache[key] = rules
+        return rules
+
+    def _get_severity_overrides(self, app_label: Optional[str]) -> dict[str, Severity]:
+        """Return the RULE_SEVERITY overrides in effect for ``app_label``.
+
+        Resolved once per app so applying them to each issue is a dict lookup
+        rather than a walk through the settings.
+        """
+        overrides = self._severity_cache.get(app_label)
+        if overrides is None:
+            self._resolve_app_rules(app_label)
+            overrides = self._severity_cache[app_label]
+        return overrides
+
+    def _resolve_app_rules(self, app_label: Optional[str]) -> None:
+        """Resolve the active rules and severity overrides for ``app_label``.
+
+        Both come from one batched settings lookup, so the per-app
+        configuration is walked once rather than once per rule.
+        """
+        rule_ids = [rule.rule_id for rule in self._applicable_rules]
         if self._disabled_rules is not None:
-            return rule_id not in self._disabled_rules
-        # Otherwise, use full configuration (individual + category + per-app)
-        return is_rule_enabled_for_app(rule_id, app_label)
+            enabled = frozenset(rule_ids) - self._disabled_rules
+            overrides = get_severity_overrides_for_app(app_label)
+        else:
+            enabled, overrides = get_effective_rules_for_app(app_label, rule_ids)
+        self._active_rules_cache[app_label] = tuple(
+            rule for rule in self._applicable_rules if rule.rule_id in enabled
+        )
+        self._severity_cache[app_label] = overrides
 
     def analyze_migration(
         self,
@@ -207,17 +425,10 @@ class MigrationAnalyzer:
                     )
 
         # Migration-level rules: run once per migration over all operations.
-        for rule in self.rules:
-            if not self._is_rule_enabled(rule.rule_id, app_label):
-                continue
-            if not rule.applies_to_db(self.db_vendor):
-                continue
-            if not rule.applies_to_django():
-                continue
+        severity_overrides = self._get_severity_overrides(app_label)
+        for rule in self._get_active_rules(app_label):
             for issue in rule.check_migration(migration):
-                issue.severity = get_rule_severity_for_app(
-                    issue.rule_id, issue.severity, app_label
-                )
+                issue.severity = severity_overrides.get(issue.rule_id, issue.severity)
                 if issue.file_path is None:
                     issue.file_path = file_path
                 if issue.app_label is None:
@@ -359,19 +570,11 @@ class MigrationAnalyzer:
                 loader=loader,
             )
 
-        for rule in self.rules:
-            # Skip disabled rules (individual, category-based, or per-app)
-            if not self._is_rule_enabled(rule.rule_id, app_label):
-                continue
-
-            # Skip rules that don't apply to this database
-            if not rule.applies_to_db(self.db_vendor):
-                continue
-
-            # Skip rules that require a newer Django than is installed
-            if not rule.applies_to_django():
-                continue
-
+        severity_overrides = self._get_severity_overrides(app_label)
+        # Active rules are already filtered by enablement (individual,
+        # category-based, per-app), database vendor, Django version and the
+        # operation types they declare.
+        for rule in self._get_rules_for_operation(app_label, type(operation)):
             # Check for inline suppression comments
             if file_path and operation_line:
                 if is_operation_suppressed(
@@ -392,9 +595,7 @@ class MigrationAnalyzer:
                 continue
 
             # Apply severity override from settings (per-app or global)
-            issue.severity = get_rule_severity_for_app(
-                issue.rule_id, issue.severity, app_label
-            )
+            issue.severity = severity_overrides.get(issue.rule_id, issue.severity)
 
             # Enrich issue with context
             if issue.file_path is None:
@@ -428,24 +629,42 @@ class MigrationAnalyzer:
         Returns:
             A list of Issue objects found in the app's migrations.
         """
-        from django.db.migrations.loader import MigrationLoader
-
-        issues: list[Issue] = []
         if loader is None:
-            loader = MigrationLoader(None, ignore_no_migrations=True)
+            loader = self.get_loader()
 
         # Get all migrations for this app from disk_migrations.
         # Use disk_migrations values directly instead of get_migration()
         # because get_migration() uses graph.nodes, which may not contain
         # replaced/squashed migrations (causing KeyError).
-        app_migrations = [
-            (name, migration)
-            for (app, name), migration in loader.disk_migrations.items()
-            if app == app_label
-        ]
-
-        # Sort by migration name
-        app_migrations.sort(key=lambda x: x[0])
+        # Single pass over disk_migrations, sorted by migration name.
+        app_migrations = sorted(
+            (
+                (name, migration)
+                for (app, name), migration in loader.disk_migrations.items()
+                if app == app_label
+            ),
+            key=lambda x: x[0],
+        )
+        return self._analyze_app_migrations(app_label, app_migrations, loader)
+
+    def _analyze_app_migrations(
+        self,
+        app_label: str,
+        app_migrations: list[tuple[str, Any]],
+        loader: Any,
+    ) -> list[Issue]:
+        """Analyze a prebuilt, name-sorted list of one app's migrations.
+
+        Args:
+            app_label: The app label the migrations belong to.
+            app_migrations: ``(migration_name, migration)`` pairs, sorted
+                by name.
+            loader: The MigrationLoader the migrations came from.
+
+        Returns:
+            A list of Issue objects found in the app's migrations.
+        """
+        issues: list[Issue] = []
         logger.debug("Analyzing app %s: %d migrations", app_label, len(app_migrations))
         if self.verbose:
             print(
@@ -468,35 +687,38 @@ class MigrationAnalyzer:
 
     def analyze_all(
         self,
-        exclude_apps: Optional[list[str]] = None,
+        exclude_apps: Optional[Iterable[str]] = None,
     ) -> list[Issue]:
         """Analyze all migrations in the project.
 
         Args:
-            exclude_apps: List of app labels to exclude (e.g., Django's
+            exclude_apps: App labels to exclude (e.g., Django's
                           built-in apps). If None, uses
                           SAFE_MIGRATIONS["EXCLUDED_APPS"] from settings.
 
         Returns:
             A list of Issue objects found in all migrations.
         """
-        from django.db.migrations.loader import MigrationLoader
-
         if exclude_apps is None:
             exclude_apps = get_excluded_apps()
+        excluded = frozenset(exclude_apps)
 
         issues: list[Issue] = []
-        loader = MigrationLoader(None, ignore_no_migrations=True)
-
-        # Get all apps with migrations from disk_migrations
-        apps_with_migrations = set(app for (app, _) in loader.disk_migrations.keys())
+        loader = self.get_loader()
+
+        # Group migrations by app in a single pass over disk_migrations
+        # rather than re-scanning it once per app.
+        by_app: dict[str, list[tuple[str, Any]]] = defaultdict(list)
+        for (app, name), migration in loader.disk_migrations.items():
+            by_app[app].append((name, migration))
+        apps_with_migrations = set(by_app)
         logger.debug(
             "Analyzing all apps: %d apps, excluding %s",
             len(apps_with_migrations),
-            exclude_apps,
+            sorted(excluded),
         )
 
-        checked_apps = sorted(a for a in apps_with_migrations if a not in exclude_apps)
+        checked_apps = sorted(apps_with_migrations - excluded)
         if self.verbose:
             print(
                 f"Analyzing {len(checked_apps)} app(s) "
@@ -504,21 +726,72 @@ class MigrationAnalyzer:
                 file=sys.stderr,
             )
 
-        for app_label in sorted(apps_with_migrations):
-            if app_label in exclude_apps:
-                logger.debug("Skipping excluded app: %s", app_label)
-                continue
-            issues.extend(self.analyze_app(app_label, loader=loader))
+        for app_label in sorted(apps_with_migrations.difference(checked_apps)):
+            logger.debug("Skipping excluded app: %s", app_label)
+
+        # The cache is a single in-memory object owned by this process, so
+        # cached runs stay serial.
+        parallel_issues = None
+        if (
+            self.jobs > 1
+            and self.cache is None
+            and len(checked_apps) >= _MIN_PARALLEL_APPS
+        ):
+            parallel_issues = self._analyze_apps_parallel(checked_apps)
+
+        if parallel_issues is not None:
+            issues = parallel_issues
+        else:
+            for app_label in checked_apps:
+                app_migrations = sorted(by_app[app_label], key=lambda x: x[0])
+                issues.extend(
+                    self._analyze_app_migrations(app_label, app_migrations, loader)
+                )
 
         logger.info("Analysis complete: %d total issues found", len(issues))
         if self.verbose:
             print(f"Analysis complete: {len(issues)} issue(s) found", file=sys.stderr)
         return issues
 
+    def _analyze_apps_parallel(self, app_labels: list[str]) -> Optional[list[Issue]]:
+        """Analyse apps across worker processes, preserving app order.
+
+        Args:
+            app_labels: Sorted app labels to analyse.
+
+        Returns:
+            The combined issues, or None if the process pool could not be
+            used (the caller then analyses serially).
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(self.jobs, len(app_labels))
+        logger.debug("Analyzing %d apps with %d workers", len(app_labels), workers)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.rules,
+                    self.db_vendor,
+                    self._disabled_rules,
+                    self.check_reverse,
+                    self.verbose,
+                ),
+            ) as pool:
+                return list(
+                    chain.from_iterable(pool.map(_analyze_app_in_worker, app_labels))
+                )
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as exc:
+            logger.warning(
+                "Parallel analysis unavailable (%s); analyzing serially", exc
+            )
+            return None
+
     def analyze_new_migrations(
         self,
         app_label: Optional[str] = None,
-        exclude_apps: Optional[list[str]] = None,
+        exclude_apps: Optional[Iterable[str]] = None,
     ) -> list[Issue]:
         """Analyze only unapplied (new) migrations.
 
@@ -527,7 +800,7 @@ class MigrationAnalyzer:
 
         Args:
             app_label: Optional app label to filter by.
-            exclude_apps: List of app labels to exclude (e.g., Django's
+            exclude_apps: App labels to exclude (e.g., Django's
                           built-in apps). If None, uses
                           SAFE_MIGRATIONS["EXCLUDED_APPS"] from settings.
 
@@ -535,22 +808,23 @@ class MigrationAnalyzer:
             A list of Issue objects found in unapplied migrations.
         """
         from django.db import connection
-        from django.db.migrations.loader import MigrationLoader
         from django.db.migrations.recorder import MigrationRecorder
 
         if exclude_apps is None:
             exclude_apps = get_excluded_apps()
 
         issues: list[Issue] = []
-        loader = MigrationLoader(connection)
+        loader = self.get_loader(connection)
         recorder = MigrationRecorder(connection)
         applied = recorder.applied_migrations()
 
+        # Membership is tested once per migration on disk.
+        excluded = frozenset(exclude_apps)
+
         unapplied_count = 0
-        for key in loader.disk_migrations.keys():
-            app, name = key
+        for (app, name), migration in loader.disk_migrations.items():
             # Skip excluded apps (Django built-ins, user-configured)
-            if app in exclude_apps:
+            if app in excluded:
                 continue
 
             # Skip if already applied
@@ -564,7 +838,6 @@ class MigrationAnalyzer:
             unapplied_count += 1
             logger.debug("Checking unapplied migration: %s.%s", app, name)
 
-            migration = loader.disk_migrations[(app, name)]
             issues.extend(
                 self.analyze_migration(
                     migration=migration,
@@ -581,6 +854,35 @@ class MigrationAnalyzer:
         )
         return issues
 
+    @staticmethod
+    def should_fail(
+        issues: Iterable[Issue],
+        fail_on_warning: bool = False,
+        warnings_as_errors: Collection[str] = (),
+    ) -> bool:
+        """Decide whether a run with these issues should exit non-zero.
+
+        Stops at the first failing issue, in a single pass.
+
+        Args:
+            issues: The issues reported by the run.
+            fail_on_warning: Treat every warning as failing.
+            warnings_as_errors: Rule IDs whose warnings are failing.
+
+        Returns:
+            True if any issue is an error, or a warning that is promoted by
+            ``fail_on_warning`` / ``warnings_as_errors``.
+        """
+        for issue in issues:
+            severity = issue.severity
+            if severity is Severity.ERROR:
+                return True
+            if severity is Severity.WARNING and (
+                fail_on_warning or issue.rule_id in warnings_as_errors
+            ):
+                return True
+        return False
+
     @staticmethod
     def get_summary(issues: list[Issue]) -> dict[str, Any]:
         """Get a summary of the issues found.
@@ -591,31 +893,14 @@ class MigrationAnalyzer:
         Returns:
             A dictionary with counts by severity and rule.
         """
-        summary: dict[str, Any] = {
+        by_severity = Counter(issue.severity.value for issue in issues)
+        return {
             "total": len(issues),
             "by_severity": {
-                "error": 0,
-                "warning": 0,
-                "info": 0,
+                "error": by_severity["error"],
+                "warning": by_severity["warning"],
+                "info": by_severity["info"],
             },
-            "by_rule": {},
-            "by_app": {},
+            "by_rule": dict(Counter(issue.rule_id for issue in issues)),
+            "by_app": dict(Counter(issue.app_label or "unknown" for issue in issues)),
         }
-
-        for issue in issues:
-            # Count by severity
-            severity = issue.severity.value
-            summary["by_severity"][severity] += 1
-
-            # Count by rule
-            if issue.rule_id not in summary["by_rule"]:
-                summary["by_rule"][issue.rule_id] = 0
-            summary["by_rule"][issue.rule_id] += 1
-
-            # Count by app
-            app = issue.app_label or "unknown"
-            if app not in summary["by_app"]:
-                summary["by_app"][app] = 0
-            summary["by_app"][app] += 1
-
-        return summary
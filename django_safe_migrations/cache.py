@@ -74,10 +74,11 @@ def compute_fingerprint(
     from django_safe_migrations import __version__
     from django_safe_migrations.conf import get_config
 
+    config = get_config()
     try:
-        config_blob = json.dumps(get_config(), sort_keys=True, default=repr)
+        config_blob = json.dumps(config, sort_keys=True, default=repr)
     except (TypeError, ValueError):  # pragma: no cover - defensive
-        config_blob = repr(get_config())
+        config_blob = repr(config)
 
     parts = {
         "cache_version": CACHE_VERSION,
@@ -24,7 +24,7 @@ from __future__ import annotations
 
 import logging
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 if TYPE_CHECKING:
     from django.db.migrations import Migration
@@ -135,7 +135,7 @@ def classify_migration(migration: Migration) -> tuple[Phase, dict[str, int]]:
 
 def classify_all(
     app_labels: Optional[list[str]] = None,
-    exclude_apps: Optional[list[str]] = None,
+    exclude_apps: Optional[Iterable[str]] = None,
 ) -> list[dict[str, Any]]:
     """Classify every migration on disk (optionally filtered by app).
 
@@ -149,7 +149,7 @@ def classify_all(
     """
     from django.db.migrations.loader import MigrationLoader
 
-    exclude = set(exclude_apps or [])
+    exclude = frozenset(exclude_apps or ())
     only = set(app_labels) if app_labels else None
 
     loader = MigrationLoader(None, ignore_no_migrations=True)
@@ -7,8 +7,11 @@ without requiring Django's manage.py.
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import sys
+from collections import defaultdict
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from django_safe_migrations.cache import DEFAULT_CACHE_FILE as _DEFAULT_CACHE_FILE
@@ -17,27 +20,123 @@ if TYPE_CHECKING:
     from argparse import Namespace
 
 
+# Set once django.setup() has succeeded in this process so repeated calls
+# (e.g. from watch mode) don't re-run app loading.
+_DJANGO_READY = False
+
+# Settings modules probed, in order, when DJANGO_SETTINGS_MODULE is unset.
+_SETTINGS_CANDIDATES = ("settings", "config.settings", "project.settings")
+
+# Set (to any non-empty value) to stop remembering which candidate worked.
+_NO_SETTINGS_HINT_ENV = "DJANGO_SAFE_MIGRATIONS_NO_SETTINGS_HINT"
+
+# Directories remembered in the hint file; the least recently used go first.
+_MAX_SETTINGS_HINTS = 100
+
+
+def _settings_hint_path() -> Path:
+    """Return the path of the per-user settings-module hint file."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "django-safe-migrations" / "settings_module.json"
+
+
+def _settings_hint_enabled() -> bool:
+    """Return False if the settings-module hint is disabled by environment."""
+    return not os.environ.get(_NO_SETTINGS_HINT_ENV)
+
+
+def _clear_settings_hint() -> bool:
+    """Delete the settings-module hint file.
+
+    Returns:
+        True if a hint file was removed, False if there was none.
+    """
+    try:
+        _settings_hint_path().unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _read_settings_hint() -> str | None:
+    """Return the settings module that last worked for the current directory.
+
+    The hint is best-effort: a missing or unreadable file yields None.
+    """
+    try:
+        hints = json.loads(_settings_hint_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    hint = hints.get(os.getcwd()) if isinstance(hints, dict) else None
+    return hint if isinstance(hint, str) else None
+
+
+def _write_settings_hint(settings_module: str) -> None:
+    """Remember the settings module that worked for the current directory."""
+    path = _settings_hint_path()
+    try:
+        hints = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(hints, dict):
+            hints = {}
+    except (OSError, ValueError):
+        hints = {}
+    cwd = os.getcwd()
+    if hints.get(cwd) == settings_module:
+        return
+    # Re-insert so the newest directory is last, then drop the oldest.
+    hints.pop(cwd, None)
+    hints[cwd] = settings_module
+    for stale in list(hints)[:-_MAX_SETTINGS_HINTS]:
+        del hints[stale]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(hints, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
 def setup_django() -> bool:
     """Configure Django settings for standalone CLI usage.
 
+    When ``DJANGO_SETTINGS_MODULE`` is unset, a few common module names are
+    probed. The one that works is remembered per working directory (under
+    ``$XDG_CACHE_HOME/django-safe-migrations``) and tried first next time,
+    unless ``DJANGO_SAFE_MIGRATIONS_NO_SETTINGS_HINT`` is set.
+
     Returns:
         True if Django was set up successfully, False otherwise.
     """
+    global _DJANGO_READY
+
+    if _DJANGO_READY:
+        return True
+
     # Try to configure Django
     settings_module = os.environ.get("DJANGO_SETTINGS_MODULE")
 
     if not settings_module:
+        candidates = list(_SETTINGS_CANDIDATES)
+        use_hint = _settings_hint_enabled()
+        hint = _read_settings_hint() if use_hint else None
+        if hint:
+            candidates = [hint] + [c for c in candidates if c != hint]
+
         # Try common settings module names
-        for candidate in ["settings", "config.settings", "project.settings"]:
+        for candidate in candidates:
             try:
                 os.environ["DJANGO_SETTINGS_MODULE"] = candidate
                 import django
 
                 django.setup()
-                return True
             except Exception:  # noqa: S110, BLE001  # nosec B112
                 # Continue trying other candidates
                 continue
+            _DJANGO_READY = True
+            if use_hint:
+                _write_settings_hint(candidate)
+            return True
 
         # Reset if none worked
         if "DJANGO_SETTINGS_MODULE" in os.environ:
@@ -50,7 +149,6 @@ def setup_django() -> bool:
         import django
 
         django.setup()
-        return True
     except Exception as exc:  # noqa: BLE001
         print(
             f"Error: failed to configure Django with "
@@ -59,6 +157,8 @@ def setup_django() -> bool:
             file=sys.stderr,
         )
         return False
+    _DJANGO_READY = True
+    return True
 
 
 def list_rules(output_format: str = "console") -> int:
@@ -72,44 +172,14 @@ def list_rules(output_format: str = "console") -> int:
     Returns:
         Exit code (always 0).
     """
-    import json as json_module
-
-    from django_safe_migrations.conf import get_category_for_rule
-    from django_safe_migrations.rules import ALL_RULES, _load_extra_rules
-
-    # Collect both built-in and custom rules
-    all_rule_classes = list(ALL_RULES) + _load_extra_rules()
-
-    rules_data = []
-    for rule_cls in all_rule_classes:
-        rule = rule_cls()
-        categories = get_category_for_rule(rule.rule_id)
-        db_vendors = rule.db_vendors if rule.db_vendors else ["all"]
-
-        rules_data.append(
-            {
-                "rule_id": rule.rule_id,
-                "severity": rule.severity.value,
-                "description": rule.description,
-                "categories": categories,
-                "db_vendors": db_vendors,
-            }
-        )
+    from django_safe_migrations.rules import format_rules_listing, get_rules_info
+
+    rules_data = get_rules_info()
 
     if output_format == "json":
-        print(json_module.dumps(rules_data, indent=2))
+        print(json.dumps(rules_data, indent=2))
     else:
-        # Console table format
-        print("Available Rules:")
-        print("-" * 80)
-        for rule_info in rules_data:
-            severity_str = str(rule_info["severity"]).upper()
-            categories_str = ", ".join(rule_info["categories"]) or "none"
-            db_str = ", ".join(rule_info["db_vendors"])
-            print(f"{rule_info['rule_id']} [{severity_str}] {rule_info['description']}")
-            print(f"    Categories: {categories_str}")
-            print(f"    Databases: {db_str}")
-            print()
+        print("\n".join(format_rules_listing(rules_data)))
 
     return 0
 
@@ -158,6 +228,11 @@ Documentation: https://django-safe-migrations.readthedocs.io/
         action="store_true",
         help="List all available rules and exit",
     )
+    parser.add_argument(
+        "--clear-settings-hint",
+        action="store_true",
+        help=("Forget the remembered settings module for every directory " "and exit"),
+    )
     parser.add_argument(
         "--fail-on-warning",
         action="store_true",
@@ -261,6 +336,17 @@ Documentation: https://django-safe-migrations.readthedocs.io/
         metavar="PATH",
         help="Path to the cache file (implies --cache)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Analyze apps in N parallel processes (default: 1; 0 uses all "
+            "CPUs). Ignored with --cache"
+        ),
+    )
     parser.add_argument(
         "--check-reverse",
         action="store_true",
@@ -284,6 +370,15 @@ Documentation: https://django-safe-migrations.readthedocs.io/
     if args.list_rules:
         return list_rules(args.format)
 
+    if args.clear_settings_hint:
+        removed = _clear_settings_hint()
+        print(
+            f"Removed {_settings_hint_path()}"
+            if removed
+            else "No remembered settings module to clear"
+        )
+        return 0
+
     # Setup Django. When DJANGO_SETTINGS_MODULE was explicitly set,
     # setup_django() already reported the underlying error; only show the
     # "please set it" hint when it is genuinely not set.
@@ -299,13 +394,13 @@ Documentation: https://django-safe-migrations.readthedocs.io/
     # Import after Django setup
     from django_safe_migrations.analyzer import MigrationAnalyzer
     from django_safe_migrations.conf import (
+        DJANGO_BUILTIN_APPS,
         get_database_vendor,
         get_fail_on_warning,
         get_warnings_as_errors,
         log_config_warnings,
     )
-    from django_safe_migrations.reporters import get_reporter
-    from django_safe_migrations.rules.base import Issue, Severity
+    from django_safe_migrations.rules.base import Issue
 
     # Validate configuration and log any warnings
     log_config_warnings()
@@ -317,18 +412,10 @@ Documentation: https://django-safe-migrations.readthedocs.io/
         watch_migrations()
         return 0
 
-    # Build exclude list
-    exclude_apps = list(args.exclude_apps)
+    # Build exclude set
+    exclude_apps = frozenset(args.exclude_apps)
     if not args.include_django_apps:
-        django_apps = [
-            "admin",
-            "auth",
-            "contenttypes",
-            "sessions",
-            "messages",
-            "staticfiles",
-        ]
-        exclude_apps = list(set(exclude_apps + django_apps))
+        exclude_apps |= DJANGO_BUILTIN_APPS
 
     # Handle --classify-phase: report deployment phases and exit (no analysis).
     if args.classify_phase:
@@ -346,6 +433,7 @@ Documentation: https://django-safe-migrations.readthedocs.io/
         db_vendor=db_vendor_override,
         verbose=args.verbose,
         check_reverse=args.check_reverse,
+        jobs=args.jobs,
     )
 
     # Optional result cache (--cache / --cache-file). Opt-in; namespaced by a
@@ -399,13 +487,15 @@ Documentation: https://django-safe-migrations.readthedocs.io/
                 f"Diff mode ({mode_desc}): checking {len(changed)} migration(s)",
                 file=sys.stderr,
             )
+        # Analyse each affected app once, however many of its migrations
+        # changed, then keep only the issues from the changed migrations.
+        changed_by_app: dict[str, set[str]] = defaultdict(set)
         for app_label, migration_name in changed:
             if app_label not in exclude_apps:
-                app_issues = analyzer.analyze_app(app_label)
-                # Filter to only the changed migration
-                issues.extend(
-                    i for i in app_issues if i.migration_name == migration_name
-                )
+                changed_by_app[app_label].add(migration_name)
+        for app_label, migration_names in changed_by_app.items():
+            app_issues = analyzer.analyze_app(app_label)
+            issues.extend(i for i in app_issues if i.migration_name in migration_names)
     elif args.new_only:
         if args.app_labels:
             for app_label in args.app_labels:
@@ -457,6 +547,8 @@ Documentation: https://django-safe-migrations.readthedocs.io/
         issues = review_issues_interactively(issues)
 
     # Get reporter
+    from django_safe_migrations.reporters import get_reporter
+
     reporter_kwargs: dict[str, object] = {"stream": sys.stdout}
     if args.format == "console":
         reporter_kwargs["show_suggestions"] = not args.no_suggestions
@@ -464,17 +556,11 @@ Documentation: https://django-safe-migrations.readthedocs.io/
     reporter = get_reporter(args.format, **reporter_kwargs)
 
     # Generate report
-    reporter.report(issues)
+    reporter.write_report(issues)
 
     # Determine exit code (CLI flag OR settings-level FAIL_ON_WARNING)
     fail_on_warning = args.fail_on_warning or get_fail_on_warning()
-    errors = [i for i in issues if i.severity == Severity.ERROR]
-    warnings = [i for i in issues if i.severity == Severity.WARNING]
-    promoted = [i for i in warnings if i.rule_id in warnings_as_errors]
-
-    if errors or promoted:
-        return 1
-    elif warnings and fail_on_warning:
+    if MigrationAnalyzer.should_fail(issues, fail_on_warning, warnings_as_errors):
         return 1
 
     return 0
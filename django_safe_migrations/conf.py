@@ -43,10 +43,12 @@ Example::
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from django.conf import settings
+from django.core.signals import setting_changed
 
 from django_safe_migrations.rules.base import Severity
 
@@ -169,20 +171,36 @@ RULE_CATEGORIES: dict[str, list[str]] = {
     "performance": ["SM022", "SM025", "SM026", "SM028", "SM033", "SM041", "SM054"],
 }
 
+# Lookup indexes derived from RULE_CATEGORIES, in both directions.
+_RULES_BY_CATEGORY: dict[str, frozenset[str]] = {
+    category: frozenset(rules) for category, rules in RULE_CATEGORIES.items()
+}
+
+
+def _index_categories_by_rule() -> dict[str, tuple[str, ...]]:
+    """Invert RULE_CATEGORIES, keeping category declaration order."""
+    index: dict[str, list[str]] = {}
+    for category, rules in _RULES_BY_CATEGORY.items():
+        for rule_id in rules:
+            index.setdefault(rule_id, []).append(category)
+    return {rule_id: tuple(categories) for rule_id, categories in index.items()}
+
+
+_CATEGORIES_BY_RULE = _index_categories_by_rule()
+
+# Django's own apps, excluded from checks unless --include-django-apps is given
+DJANGO_BUILTIN_APPS: frozenset[str] = frozenset(
+    {"admin", "auth", "contenttypes", "sessions", "messages", "staticfiles"}
+)
+
 # Default configuration values
 DEFAULTS: dict[str, Any] = {
     "DISABLED_RULES": [],
     "DISABLED_CATEGORIES": [],
     "ENABLED_CATEGORIES": [],  # Empty = all categories enabled
     "RULE_SEVERITY": {},
-    "EXCLUDED_APPS": [
-        "admin",
-        "auth",
-        "contenttypes",
-        "sessions",
-        "messages",
-        "staticfiles",
-    ],
+    # Sorted so the default (and the cache fingerprint) is deterministic.
+    "EXCLUDED_APPS": sorted(DJANGO_BUILTIN_APPS),
     "FAIL_ON_WARNING": False,
     "APP_RULES": {},  # Per-app rule configuration
     "EXTRA_RULES": [],  # Custom rule class paths to load
@@ -222,6 +240,59 @@ def load_pyproject_config() -> dict[str, Any]:
     return _read_pyproject_section()
 
 
+# Stand-in for an unset SAFE_MIGRATIONS, so "not configured" has a stable
+# identity for the memoization check in _sync_config_cache().
+_NO_USER_CONFIG: dict[str, Any] = {}
+
+# The (SAFE_MIGRATIONS, pyproject config) objects the memoized lookups below
+# were computed from. The objects themselves are held, not their ids, so an
+# identity match can never be a recycled address.
+_config_sources: Optional[tuple[Any, Any]] = None
+
+
+def clear_config_cache() -> None:
+    """Drop memoized settings lookups so the next call re-reads settings.
+
+    Replacing ``settings.SAFE_MIGRATIONS`` (including via
+    ``override_settings``) is picked up automatically; call this after
+    mutating the dict in place.
+    """
+    global _config_sources
+    _config_sources = None
+    _merged_config.cache_clear()
+    _disabled_rule_ids.cache_clear()
+    _rule_enabled_globally.cache_clear()
+    _rule_enabled_for_app.cache_clear()
+    _resolved_app_policy.cache_clear()
+    _enabled_rule_ids_for_app.cache_clear()
+    _effective_severity_overrides.cache_clear()
+    _excluded_apps.cache_clear()
+
+
+def _sync_config_cache() -> None:
+    """Clear memoized lookups if the configuration sources were replaced."""
+    global _config_sources
+    user_config = getattr(settings, "SAFE_MIGRATIONS", _NO_USER_CONFIG)
+    pyproject_config = load_pyproject_config()
+    cached = _config_sources
+    if (
+        cached is None
+        or cached[0] is not user_config
+        or cached[1] is not pyproject_config
+    ):
+        clear_config_cache()
+        _config_sources = (user_config, pyproject_config)
+
+
+def _on_setting_changed(*, setting: str, **kwargs: Any) -> None:
+    """Invalidate memoized lookups when SAFE_MIGRATIONS is overridden."""
+    if setting == "SAFE_MIGRATIONS":
+        clear_config_cache()
+
+
+setting_changed.connect(_on_setting_changed, dispatch_uid="django_safe_migrations.conf")
+
+
 def get_config() -> dict[str, Any]:
     """Get the merged configuration from Django settings.
 
@@ -229,31 +300,43 @@ def get_config() -> dict[str, Any]:
         A dictionary with all configuration values, using defaults
         for any values not specified in settings.
     """
-    user_config = getattr(settings, "SAFE_MIGRATIONS", {})
+    return dict(_config())
+
+
+def _config() -> dict[str, Any]:
+    """Return the shared merged config; internal read-only access."""
+    _sync_config_cache()
+    return _merged_config()
+
+
+@lru_cache(maxsize=1)
+def _merged_config() -> dict[str, Any]:
+    """Merge defaults, pyproject.toml and Django settings once."""
+    user_config = getattr(settings, "SAFE_MIGRATIONS", _NO_USER_CONFIG)
 
     # Precedence: defaults < pyproject.toml < Django settings.
-    config = DEFAULTS.copy()
-    config.update(load_pyproject_config())
-    config.update(user_config)
+    # ``|=`` (like update()) also accepts non-dict mappings from settings.
+    config = DEFAULTS | load_pyproject_config()
+    config |= user_config
 
     return config
 
 
 def get_database_vendor() -> Optional[str]:
     """Get the configured database-vendor override, or None for auto-detect."""
-    vendor = get_config().get("DATABASE_VENDOR")
+    vendor = _config().get("DATABASE_VENDOR")
     return str(vendor) if vendor else None
 
 
 def get_warnings_as_errors() -> list[str]:
     """Get the list of rule IDs whose warnings should fail the build."""
-    value = get_config().get("WARNINGS_AS_ERRORS", [])
+    value = _config().get("WARNINGS_AS_ERRORS", [])
     return list(value) if value else []
 
 
 def get_block_unsafe() -> bool:
     """Get whether a system check should block migrate on ERROR-level issues."""
-    return bool(get_config().get("BLOCK_UNSAFE", False))
+    return bool(_config().get("BLOCK_UNSAFE", False))
 
 
 def get_disabled_rules() -> list[str]:
@@ -262,9 +345,48 @@ def get_disabled_rules() -> list[str]:
     Returns:
         A list of rule IDs to disable (e.g., ["SM006", "SM008"]).
     """
-    config = get_config()
-    disabled: list[str] = config.get("DISABLED_RULES", [])
-    return disabled
+    config = _config()
+    return list(config.get("DISABLED_RULES", []))
+
+
+# Case-insensitive lookup by Severity value or member name.
+# Every spelling of each member's name and value in original, lower and
+# upper case, so the common forms resolve with a single dict lookup.
+_SEVERITY_BY_NAME: dict[str, Severity] = {
+    form: severity
+    for severity in Severity
+    for text in (severity.name, severity.value)
+    for form in (text, text.lower(), text.upper())
+}
+
+
+def _parse_severity(value: Any) -> Severity | None:
+    """Convert a configured severity (value or member name) to a Severity.
+
+    Args:
+        value: A Severity, or a string such as ``"error"`` or ``"ERROR"``.
+
+    Returns:
+        The matching Severity, or None if the value is not recognised.
+    """
+    if isinstance(value, Severity):
+        return value
+    if isinstance(value, str):
+        severity = _SEVERITY_BY_NAME.get(value)
+        if severity is None:
+            severity = _SEVERITY_BY_NAME.get(value.lower())
+        return severity
+    return None
+
+
+def _parse_severity_map(raw_overrides: dict[str, Any]) -> dict[str, Severity]:
+    """Convert a RULE_SEVERITY mapping, dropping unrecognised values."""
+    overrides: dict[str, Severity] = {}
+    for rule_id, severity_str in raw_overrides.items():
+        severity = _parse_severity(severity_str)
+        if severity is not None:
+            overrides[rule_id] = severity
+    return overrides
 
 
 def get_severity_overrides() -> dict[str, Severity]:
@@ -273,23 +395,17 @@ def get_severity_overrides() -> dict[str, Severity]:
     Returns:
         A dictionary mapping rule IDs to Severity levels.
     """
-    config = get_config()
-    raw_overrides = config.get("RULE_SEVERITY", {})
+    _sync_config_cache()
+    return dict(_effective_severity_overrides(None))
 
-    # Convert string severity names to Severity enum
-    overrides: dict[str, Severity] = {}
-    for rule_id, severity_str in raw_overrides.items():
-        if isinstance(severity_str, str):
-            try:
-                overrides[rule_id] = Severity(severity_str.lower())
-            except ValueError:
-                # Try matching by name
-                severity_str_upper = severity_str.upper()
-                if hasattr(Severity, severity_str_upper):
-                    overrides[rule_id] = getattr(Severity, severity_str_upper)
-        elif isinstance(severity_str, Severity):
-            overrides[rule_id] = severity_str
 
+@lru_cache(maxsize=None)
+def _effective_severity_overrides(app_label: Optional[str]) -> dict[str, Severity]:
+    """Parse the global and per-app RULE_SEVERITY once per configuration."""
+    overrides = _parse_severity_map(_config().get("RULE_SEVERITY", {}))
+    policy = _resolved_app_policy(app_label) if app_label else None
+    if policy is not None:
+        overrides.update(policy.severity_overrides)
     return overrides
 
 
@@ -299,9 +415,15 @@ def get_excluded_apps() -> list[str]:
     Returns:
         A list of app labels to exclude.
     """
-    config = get_config()
-    excluded: list[str] = config.get("EXCLUDED_APPS", DEFAULTS["EXCLUDED_APPS"])
-    return excluded
+    _sync_config_cache()
+    return list(_excluded_apps())
+
+
+@lru_cache(maxsize=1)
+def _excluded_apps() -> tuple[str, ...]:
+    """Resolve EXCLUDED_APPS once per configuration."""
+    config = _config()
+    return tuple(config.get("EXCLUDED_APPS", DEFAULTS["EXCLUDED_APPS"]))
 
 
 def get_fail_on_warning() -> bool:
@@ -310,7 +432,7 @@ def get_fail_on_warning() -> bool:
     Returns:
         True if warnings should cause failure, False otherwise.
     """
-    config = get_config()
+    config = _config()
     fail_on_warning: bool = config.get("FAIL_ON_WARNING", False)
     return fail_on_warning
 
@@ -324,7 +446,14 @@ def is_rule_disabled(rule_id: str) -> bool:
     Returns:
         True if the rule is disabled, False otherwise.
     """
-    return rule_id in get_disabled_rules()
+    _sync_config_cache()
+    return rule_id in _disabled_rule_ids()
+
+
+@lru_cache(maxsize=1)
+def _disabled_rule_ids() -> frozenset[str]:
+    """Resolve DISABLED_RULES into a set once per configuration."""
+    return frozenset(_config().get("DISABLED_RULES", []))
 
 
 def get_rule_severity(rule_id: str, default: Severity) -> Severity:
@@ -337,8 +466,8 @@ def get_rule_severity(rule_id: str, default: Severity) -> Severity:
     Returns:
         The configured severity for the rule.
     """
-    overrides = get_severity_overrides()
-    return overrides.get(rule_id, default)
+    _sync_config_cache()
+    return _effective_severity_overrides(None).get(rule_id, default)
 
 
 def get_disabled_categories() -> list[str]:
@@ -347,7 +476,7 @@ def get_disabled_categories() -> list[str]:
     Returns:
         A list of category names to disable.
     """
-    config = get_config()
+    config = _config()
     disabled: list[str] = config.get("DISABLED_CATEGORIES", [])
     return disabled
 
@@ -360,7 +489,7 @@ def get_enabled_categories() -> list[str]:
     Returns:
         A list of category names to enable (empty = all enabled).
     """
-    config = get_config()
+    config = _config()
     enabled: list[str] = config.get("ENABLED_CATEGORIES", [])
     return enabled
 
@@ -386,19 +515,30 @@ def get_all_categories() -> list[str]:
     return list(RULE_CATEGORIES.keys())
 
 
-def get_rules_from_categories(categories: list[str]) -> set[str]:
+def get_rules_from_categories(categories: Iterable[str]) -> set[str]:
     """Get all rule IDs from multiple categories.
 
     Args:
-        categories: List of category names.
+        categories: Category names, in any order; duplicates are ignored.
 
     Returns:
         A set of all rule IDs in those categories.
     """
-    rules: set[str] = set()
-    for category in categories:
-        rules.update(get_rules_in_category(category))
-    return rules
+    return set(_category_rules(categories))
+
+
+def _category_rules(categories: Iterable[str]) -> frozenset[str]:
+    """Return the shared, memoized rule set for a group of categories."""
+    return _rules_from_categories(tuple(sorted(set(categories))))
+
+
+@lru_cache(maxsize=128)
+def _rules_from_categories(categories: tuple[str, ...]) -> frozenset[str]:
+    """Union the rule sets of the given (sorted, unique) category names."""
+    empty: frozenset[str] = frozenset()
+    return empty.union(
+        *(_RULES_BY_CATEGORY.get(category, empty) for category in categories)
+    )
 
 
 def is_rule_disabled_by_category(rule_id: str) -> bool:
@@ -420,7 +560,7 @@ def is_rule_disabled_by_category(rule_id: str) -> bool:
 
     # If whitelist mode (ENABLED_CATEGORIES is set)
     if enabled_categories:
-        enabled_rules = get_rules_from_categories(enabled_categories)
+        enabled_rules = _category_rules(enabled_categories)
         if rule_id not in enabled_rules:
             logger.debug(
                 "Rule %s disabled: not in enabled categories %s",
@@ -431,7 +571,7 @@ def is_rule_disabled_by_category(rule_id: str) -> bool:
 
     # Check if rule is in a disabled category
     if disabled_categories:
-        disabled_by_category = get_rules_from_categories(disabled_categories)
+        disabled_by_category = _category_rules(disabled_categories)
         if rule_id in disabled_by_category:
             logger.debug(
                 "Rule %s disabled: in disabled categories %s",
@@ -457,6 +597,17 @@ def is_rule_enabled(rule_id: str) -> bool:
     Returns:
         True if the rule should run, False otherwise.
     """
+    _sync_config_cache()
+    return _rule_enabled_globally(rule_id)
+
+
+@lru_cache(maxsize=None)
+def _rule_enabled_globally(rule_id: str) -> bool:
+    """Decide global enablement for a rule once per configuration.
+
+    Memoized per rule ID rather than precomputed for the registry, so rules
+    passed straight to the analyzer are handled like registered ones.
+    """
     # Check individual disable first
     if is_rule_disabled(rule_id):
         return False
@@ -477,11 +628,7 @@ def get_category_for_rule(rule_id: str) -> list[str]:
     Returns:
         A list of category names the rule belongs to.
     """
-    categories = []
-    for category, rules in RULE_CATEGORIES.items():
-        if rule_id in rules:
-            categories.append(category)
-    return categories
+    return list(_CATEGORIES_BY_RULE.get(rule_id, ()))
 
 
 # -----------------------------------------------------------------------------
@@ -495,7 +642,7 @@ def get_app_rules_config() -> dict[str, dict[str, Any]]:
     Returns:
         A dictionary mapping app labels to their rule configurations.
     """
-    config = get_config()
+    config = _config()
     app_rules: dict[str, dict[str, Any]] = config.get("APP_RULES", {})
     return app_rules
 
@@ -529,20 +676,29 @@ def is_rule_enabled_for_app(rule_id: str, app_label: str | None = None) -> bool:
     Returns:
         True if the rule should run for this app, False otherwise.
     """
+    _sync_config_cache()
+
     # If no app specified, use global configuration
     if app_label is None:
-        return is_rule_enabled(rule_id)
+        return _rule_enabled_globally(rule_id)
 
-    # Get app-specific configuration
-    app_config = get_app_config(app_label)
+    return _rule_enabled_for_app(rule_id, app_label)
+
+
+@lru_cache(maxsize=None)
+def _rule_enabled_for_app(rule_id: str, app_label: str) -> bool:
+    """Decide enablement for a rule in an app once per configuration.
 
+    Memoizing the decision (not just the app policy) keeps the debug
+    logging below off the per-call path: each reason is logged once.
+    """
     # If no app-specific config, fall back to global
-    if not app_config:
-        return is_rule_enabled(rule_id)
+    policy = _resolved_app_policy(app_label)
+    if policy is None:
+        return _rule_enabled_globally(rule_id)
 
     # Check app-specific DISABLED_RULES first
-    app_disabled_rules = app_config.get("DISABLED_RULES", [])
-    if rule_id in app_disabled_rules:
+    if rule_id in policy.disabled_rules:
         logger.debug(
             "Rule %s disabled for app %s: in app DISABLED_RULES",
             rule_id,
@@ -550,37 +706,122 @@ def is_rule_enabled_for_app(rule_id: str, app_label: str | None = None) -> bool:
         )
         return False
 
-    # Check app-specific category configuration
-    app_enabled_categories = app_config.get("ENABLED_CATEGORIES", [])
-    app_disabled_categories = app_config.get("DISABLED_CATEGORIES", [])
-
     # App-level whitelist mode
-    if app_enabled_categories:
-        enabled_rules = get_rules_from_categories(app_enabled_categories)
-        if rule_id not in enabled_rules:
-            logger.debug(
-                "Rule %s disabled for app %s: not in app ENABLED_CATEGORIES %s",
-                rule_id,
-                app_label,
-                app_enabled_categories,
-            )
-            return False
+    if (
+        policy.enabled_category_rules is not None
+        and rule_id not in policy.enabled_category_rules
+    ):
+        logger.debug(
+            "Rule %s disabled for app %s: not in app ENABLED_CATEGORIES %s",
+            rule_id,
+            app_label,
+            list(policy.enabled_categories),
+        )
+        return False
 
     # App-level disabled categories
-    if app_disabled_categories:
-        disabled_by_category = get_rules_from_categories(app_disabled_categories)
-        if rule_id in disabled_by_category:
-            logger.debug(
-                "Rule %s disabled for app %s: in app DISABLED_CATEGORIES %s",
-                rule_id,
-                app_label,
-                app_disabled_categories,
-            )
-            return False
+    if rule_id in policy.disabled_category_rules:
+        logger.debug(
+            "Rule %s disabled for app %s: in app DISABLED_CATEGORIES %s",
+            rule_id,
+            app_label,
+            list(policy.disabled_categories),
+        )
+        return False
 
     # If app has any configuration but didn't disable this rule,
     # still check global configuration
-    return is_rule_enabled(rule_id)
+    return _rule_enabled_globally(rule_id)
+
+
+@dataclass(frozen=True)
+class _AppPolicy:
+    """An app's APP_RULES entry, resolved into lookup-ready sets.
+
+    Attributes:
+        disabled_rules: The app's DISABLED_RULES.
+        enabled_categories: The app's ENABLED_CATEGORIES, as configured.
+        enabled_category_rules: Rules in ENABLED_CATEGORIES, or None when
+            the app does not use whitelist mode.
+        disabled_categories: The app's DISABLED_CATEGORIES, as configured.
+        disabled_category_rules: Rules in DISABLED_CATEGORIES.
+        severity_overrides: The app's parsed RULE_SEVERITY entries.
+    """
+
+    __slots__ = (
+        "disabled_rules",
+        "enabled_categories",
+        "enabled_category_rules",
+        "disabled_categories",
+        "disabled_category_rules",
+        "severity_overrides",
+    )
+
+    disabled_rules: frozenset[str]
+    enabled_categories: tuple[str, ...]
+    enabled_category_rules: Optional[frozenset[str]]
+    disabled_categories: tuple[str, ...]
+    disabled_category_rules: frozenset[str]
+    severity_overrides: dict[str, Severity]
+
+
+@lru_cache(maxsize=None)
+def _resolved_app_policy(app_label: str) -> Optional[_AppPolicy]:
+    """Resolve an app's APP_RULES entry once per configuration.
+
+    Returns:
+        The resolved policy, or None if the app has no APP_RULES entry.
+    """
+    app_config = get_app_config(app_label)
+    if not app_config:
+        return None
+
+    enabled_categories = tuple(app_config.get("ENABLED_CATEGORIES", []))
+    disabled_categories = tuple(app_config.get("DISABLED_CATEGORIES", []))
+    return _AppPolicy(
+        disabled_rules=frozenset(app_config.get("DISABLED_RULES", [])),
+        enabled_categories=enabled_categories,
+        enabled_category_rules=(
+            _category_rules(enabled_categories) if enabled_categories else None
+        ),
+        disabled_categories=disabled_categories,
+        disabled_category_rules=_category_rules(disabled_categories),
+        severity_overrides=_parse_severity_map(app_config.get("RULE_SEVERITY", {})),
+    )
+
+
+def get_effective_rules_for_app(
+    app_label: str | None, rule_ids: Iterable[str]
+) -> tuple[frozenset[str], dict[str, Severity]]:
+    """Resolve which rules run for an app and their severity overrides.
+
+    Batched form of :func:`is_rule_enabled_for_app` and
+    :func:`get_rule_severity_for_app` for callers that check many rules
+    against the same app.
+
+    Args:
+        app_label: The app label. If None, uses global configuration only.
+        rule_ids: The candidate rule IDs.
+
+    Returns:
+        A ``(enabled_rule_ids, severity_overrides)`` pair, where the
+        overrides map rule IDs to their configured Severity.
+    """
+    _sync_config_cache()
+    return (
+        _enabled_rule_ids_for_app(app_label, frozenset(rule_ids)),
+        dict(_effective_severity_overrides(app_label or None)),
+    )
+
+
+@lru_cache(maxsize=None)
+def _enabled_rule_ids_for_app(
+    app_label: str | None, rule_ids: frozenset[str]
+) -> frozenset[str]:
+    """Filter ``rule_ids`` down to those enabled for the app."""
+    return frozenset(
+        rule_id for rule_id in rule_ids if is_rule_enabled_for_app(rule_id, app_label)
+    )
 
 
 def get_rule_severity_for_app(
@@ -596,25 +837,27 @@ def get_rule_severity_for_app(
     Returns:
         The configured severity for the rule.
     """
-    # Check app-specific severity first
-    if app_label:
-        app_config = get_app_config(app_label)
-        app_severity = app_config.get("RULE_SEVERITY", {})
-        if rule_id in app_severity:
-            severity_str = app_severity[rule_id]
-            if isinstance(severity_str, str):
-                try:
-                    return Severity(severity_str.lower())
-                except ValueError:
-                    if hasattr(Severity, severity_str.upper()):
-                        result = getattr(Severity, severity_str.upper())
-                        if isinstance(result, Severity):
-                            return result
-            elif isinstance(severity_str, Severity):
-                return severity_str
-
-    # Fall back to global severity
-    return get_rule_severity(rule_id, default)
+    # App-specific entries already take precedence in the merged map.
+    _sync_config_cache()
+    return _effective_severity_overrides(app_label or None).get(rule_id, default)
+
+
+def get_severity_overrides_for_app(app_label: str | None = None) -> dict[str, Severity]:
+    """Get the effective severity overrides for an app.
+
+    App-specific ``RULE_SEVERITY`` entries take precedence over the global
+    ones, matching :func:`get_rule_severity_for_app`. Callers that apply
+    severities to many issues can resolve this once and use plain dict
+    lookups.
+
+    Args:
+        app_label: The app label. If None, uses global configuration only.
+
+    Returns:
+        A dictionary mapping rule IDs to Severity levels.
+    """
+    _sync_config_cache()
+    return dict(_effective_severity_overrides(app_label or None))
 
 
 # -----------------------------------------------------------------------------
@@ -698,7 +941,7 @@ def validate_config() -> list[str]:
     from django_safe_migrations.rules import get_all_rule_ids
 
     warnings: list[str] = []
-    config = get_config()
+    config = _config()
 
     valid_rule_ids = get_all_rule_ids()
     valid_categories = set(RULE_CATEGORIES.keys())
@@ -822,6 +1065,6 @@ def get_extra_rules() -> list[str]:
         A list of dotted paths to custom rule classes.
         Example: ["myproject.rules.CustomRule", "another.module.MyRule"]
     """
-    config = get_config()
+    config = _config()
     extra_rules: list[str] = config.get("EXTRA_RULES", [])
     return extra_rules
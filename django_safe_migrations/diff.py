@@ -13,13 +13,18 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import subprocess  # nosec B404
-from pathlib import Path
+from functools import lru_cache
 
 from django.apps import apps as django_apps
 
 logger = logging.getLogger("django_safe_migrations")
 
+# A ``git diff --name-only`` output line naming a Python file under a
+# ``migrations/`` directory; matched over the whole output in one pass.
+_MIGRATION_PATH_RE = re.compile(r"^[ \t]*(.*/migrations/.*\.py)[ \t\r]*$", re.MULTILINE)
+
 
 class DiffError(Exception):
     """Raised when git diff fails (e.g. invalid branch/ref)."""
@@ -51,13 +56,14 @@ def _run_git_diff_names(diff_args: list[str]) -> list[str]:
     for arg in diff_args:
         if arg.startswith("-"):
             raise DiffError(f"Invalid git ref '{arg}': refs may not start with '-'.")
+    git_root = _find_git_root()
     try:
         result = subprocess.run(  # nosec B603 B607
             ["git", "diff", "--name-only", "--diff-filter=ACMR", *diff_args],
             capture_output=True,
             text=True,
             check=True,
-            cwd=_find_git_root(),
+            cwd=git_root,
         )
     except subprocess.CalledProcessError as e:
         msg = f"Could not run git diff ({' '.join(diff_args)}): {e}"
@@ -70,18 +76,13 @@ def _run_git_diff_names(diff_args: list[str]) -> list[str]:
         logger.error(msg)
         raise DiffError(msg) from e
 
-    git_root = _find_git_root()
+    # ACMR excludes deletions within the diff, but a committed-range diff
+    # (--since-commit) can still list files since removed from the worktree.
     changed: list[str] = []
-
-    for line in result.stdout.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        # Only migration Python files
-        if "/migrations/" in line and line.endswith(".py"):
-            abs_path = os.path.join(git_root, line)
-            if os.path.exists(abs_path):
-                changed.append(abs_path)
+    for match in _MIGRATION_PATH_RE.finditer(result.stdout):
+        abs_path = os.path.join(git_root, match.group(1))
+        if os.path.exists(abs_path):
+            changed.append(abs_path)
 
     return changed
 
@@ -153,21 +154,26 @@ def _files_to_app_migrations(files: list[str]) -> list[tuple[str, str]]:
     # to symlinks / non-normalized roots, and building the dict once keeps this
     # O(files) instead of O(files x app_configs).
     path_to_label = {
-        Path(app_config.path).resolve(): app_config.label
+        os.path.realpath(app_config.path): app_config.label
         for app_config in django_apps.get_app_configs()
     }
+    # Changed files cluster in a few apps; resolve each app directory once.
+    label_for_dir: dict[str, str] = {}
 
     for filepath in files:
-        path = Path(filepath)
         # Expected: .../app_name/migrations/0001_initial.py
-        migration_name = path.stem  # e.g. "0001_initial"
+        migrations_dir, filename = os.path.split(filepath)
+        migration_name = os.path.splitext(filename)[0]  # e.g. "0001_initial"
         if migration_name == "__init__":
             continue
 
-        migrations_dir = path.parent  # .../app_name/migrations/
-        app_dir = migrations_dir.parent  # .../app_name/
-
-        app_label = path_to_label.get(app_dir.resolve(), app_dir.name)
+        app_dir = os.path.dirname(migrations_dir)  # .../app_name
+        app_label = label_for_dir.get(app_dir)
+        if app_label is None:
+            app_label = path_to_label.get(
+                os.path.realpath(app_dir), os.path.basename(app_dir)
+            )
+            label_for_dir[app_dir] = app_label
 
         result.append((app_label, migration_name))
 
@@ -211,16 +217,31 @@ def get_committed_apps_and_migrations(
 def _find_git_root() -> str:
     """Find the git repository root directory.
 
+    The root is looked up once per working directory; see
+    :func:`invalidate_diff_cache`.
+
     Returns:
         Absolute path to the git root, or cwd if not in a git repo.
     """
+    return _git_root_for(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _git_root_for(cwd: str) -> str:
+    """Run ``git rev-parse --show-toplevel`` from *cwd*."""
     try:
         result = subprocess.run(  # nosec B603 B607
             ["git", "rev-parse", "--show-toplevel"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except (subprocess.CalledProcessError, FileNotFoundError):
-        return os.getcwd()
+        return cwd
+
+
+def invalidate_diff_cache() -> None:
+    """Forget cached git repository roots (e.g. after ``git init``)."""
+    _git_root_for.cache_clear()
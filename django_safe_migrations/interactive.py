@@ -8,6 +8,80 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from django_safe_migrations.rules.base import Issue
 
+_PROMPT = "  [k]eep / [s]kip / [f]ix suggestion / [q]uit: "
+
+# Ctrl-D; in cbreak mode the terminal passes it through instead of ending input.
+_EOF_CHAR = "\x04"
+
+_ENTER_KEYS = ("\r", "\n")
+
+
+def _stdin_is_terminal() -> bool:
+    """Return True if single keypresses can be read from stdin.
+
+    Needs a POSIX terminal: ``termios`` is unavailable on Windows, where
+    (as for pipes and redirected input) choices are read line by line.
+    """
+    try:
+        import termios  # noqa: F401
+    except ImportError:
+        return False
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _read_key(prompt: str) -> str:
+    """Show *prompt* and return the next keypress, without waiting for Enter.
+
+    Raises:
+        EOFError: On end of input or Ctrl-D.
+    """
+    import termios
+    import tty
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        key = sys.stdin.read(1)
+        # Ignore Enter, which users used to press after each choice.
+        while key in _ENTER_KEYS:
+            key = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    if not key or key == _EOF_CHAR:
+        raise EOFError
+    # Echo the choice, since cbreak mode does not.
+    sys.stdout.write(key + "\n")
+    return key
+
+
+def _read_choice(single_key: bool) -> str:
+    """Prompt for an action and return it normalised to lower case."""
+    if single_key:
+        return _read_key(_PROMPT).lower()
+    return input(_PROMPT).strip().lower()
+
+
+def _write_issue_header(idx: int, total: int, issue: Issue) -> None:
+    """Write the summary block for one issue to stderr in a single write."""
+    lines = [f"[{idx}/{total}] {issue.rule_id} [{issue.severity.value.upper()}]"]
+    if issue.app_label and issue.migration_name:
+        lines.append(f"  Migration: {issue.app_label}.{issue.migration_name}")
+    if issue.file_path:
+        loc = issue.file_path
+        if issue.line_number:
+            loc += f":{issue.line_number}"
+        lines.append(f"  Location: {loc}")
+    lines.append(f"  {issue.message}")
+    lines.append("\n")
+    sys.stderr.write("\n".join(lines))
+    sys.stderr.flush()
+
 
 def review_issues_interactively(issues: list[Issue]) -> list[Issue]:
     """Interactively review each issue and let the user decide the action.
@@ -18,6 +92,9 @@ def review_issues_interactively(issues: list[Issue]) -> list[Issue]:
     - [k] Keep the issue in the report
     - [q] Quit interactive mode and keep remaining issues
 
+    On a terminal each choice is a single keypress; otherwise (pipes,
+    redirected input, Windows) a line is read per choice.
+
     Args:
         issues: List of issues to review.
 
@@ -29,34 +106,16 @@ def review_issues_interactively(issues: list[Issue]) -> list[Issue]:
 
     kept: list[Issue] = []
     total = len(issues)
+    single_key = _stdin_is_terminal()
 
     print(f"\nInteractive mode: {total} issue(s) to review\n", file=sys.stderr)
 
     for idx, issue in enumerate(issues, 1):
-        print(
-            f"[{idx}/{total}] {issue.rule_id} [{issue.severity.value.upper()}]",
-            file=sys.stderr,
-        )
-        if issue.app_label and issue.migration_name:
-            print(
-                f"  Migration: {issue.app_label}.{issue.migration_name}",
-                file=sys.stderr,
-            )
-        if issue.file_path:
-            loc = issue.file_path
-            if issue.line_number:
-                loc += f":{issue.line_number}"
-            print(f"  Location: {loc}", file=sys.stderr)
-        print(f"  {issue.message}", file=sys.stderr)
-        print(file=sys.stderr)
+        _write_issue_header(idx, total, issue)
 
         while True:
             try:
-                choice = (
-                    input("  [k]eep / [s]kip / [f]ix suggestion / [q]uit: ")
-                    .strip()
-                    .lower()
-                )
+                choice = _read_choice(single_key)
             except (EOFError, KeyboardInterrupt):
                 print("\nKeeping remaining issues.", file=sys.stderr)
                 kept.extend(issues[idx - 1 :])
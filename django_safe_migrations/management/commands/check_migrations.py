@@ -10,15 +10,16 @@ from django.core.management.base import BaseCommand, CommandParser
 
 from django_safe_migrations.analyzer import MigrationAnalyzer
 from django_safe_migrations.conf import (
-    get_category_for_rule,
+    DJANGO_BUILTIN_APPS,
     get_database_vendor,
+    get_excluded_apps,
     get_fail_on_warning,
     get_warnings_as_errors,
     log_config_warnings,
 )
 from django_safe_migrations.reporters import get_reporter
-from django_safe_migrations.rules import ALL_RULES, _load_extra_rules
-from django_safe_migrations.rules.base import Issue, Severity
+from django_safe_migrations.rules import format_rules_listing, get_rules_info
+from django_safe_migrations.rules.base import Issue
 
 
 class Command(BaseCommand):
@@ -169,6 +170,17 @@ class Command(BaseCommand):
             metavar="PATH",
             help="Path to the cache file (implies --cache)",
         )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            metavar="N",
+            help=(
+                "Analyze apps in N parallel processes (default: 1; 0 uses all "
+                "CPUs). Ignored with --cache"
+            ),
+        )
         parser.add_argument(
             "--check-reverse",
             action="store_true",
@@ -194,40 +206,13 @@ class Command(BaseCommand):
         Args:
             output_format: Output format ('console' or 'json').
         """
-        # Collect both built-in and custom rules
-        all_rule_classes = list(ALL_RULES) + _load_extra_rules()
-
-        rules_data = []
-        for rule_cls in all_rule_classes:
-            rule = rule_cls()
-            categories = get_category_for_rule(rule.rule_id)
-            db_vendors = rule.db_vendors if rule.db_vendors else ["all"]
-
-            rules_data.append(
-                {
-                    "rule_id": rule.rule_id,
-                    "severity": rule.severity.value,
-                    "description": rule.description,
-                    "categories": categories,
-                    "db_vendors": db_vendors,
-                }
-            )
+        rules_data = get_rules_info()
 
         if output_format == "json":
             self.stdout.write(json.dumps(rules_data, indent=2))
         else:
-            # Console table format
-            self.stdout.write("Available Rules:")
-            self.stdout.write("-" * 80)
-            for rule_info in rules_data:
-                severity_str = str(rule_info["severity"]).upper()
-                categories_str = ", ".join(rule_info["categories"]) or "none"
-                db_str = ", ".join(rule_info["db_vendors"])
-                desc = rule_info["description"]
-                self.stdout.write(f"{rule_info['rule_id']} [{severity_str}] {desc}")
-                self.stdout.write(f"    Categories: {categories_str}")
-                self.stdout.write(f"    Databases: {db_str}")
-                self.stdout.write("")
+            for line in format_rules_listing(rules_data):
+                self.stdout.write(line)
 
     @staticmethod
     def _load_migration(
@@ -236,7 +221,8 @@ class Command(BaseCommand):
         """Load a specific migration by app label and name.
 
         Args:
-            analyzer: The migration analyzer instance (unused but kept for API).
+            analyzer: The migration analyzer instance; its shared
+                ``MigrationLoader`` is reused across lookups.
             app_label: The app label (e.g., 'myapp').
             migration_name: The migration name (e.g., '0001_initial').
 
@@ -247,9 +233,8 @@ class Command(BaseCommand):
             CommandError: If the migration cannot be found.
         """
         from django.core.management.base import CommandError
-        from django.db.migrations.loader import MigrationLoader
 
-        loader = MigrationLoader(None, ignore_no_migrations=True)
+        loader = analyzer.get_loader()
         key = (app_label, migration_name)
         if key in loader.disk_migrations:
             return loader.disk_migrations[key]
@@ -304,22 +289,11 @@ class Command(BaseCommand):
                 if rid.strip()
             )
 
-        # Build exclude list by merging CLI args with settings-level EXCLUDED_APPS
-        from django_safe_migrations.conf import get_excluded_apps
-
-        settings_exclude_apps = get_excluded_apps()
-        exclude_apps = list(set(cli_exclude_apps + settings_exclude_apps))
+        # Build exclude set by merging CLI args with settings-level EXCLUDED_APPS
+        exclude_apps = frozenset(cli_exclude_apps).union(get_excluded_apps())
 
         if not include_django_apps:
-            django_apps = [
-                "admin",
-                "auth",
-                "contenttypes",
-                "sessions",
-                "messages",
-                "staticfiles",
-            ]
-            exclude_apps = list(set(exclude_apps + django_apps))
+            exclude_apps |= DJANGO_BUILTIN_APPS
 
         # Handle --classify-phase: report deployment phases and exit.
         if options.get("classify_phase"):
@@ -336,6 +310,7 @@ class Command(BaseCommand):
             db_vendor=db_vendor_override,
             verbose=verbose,
             check_reverse=options.get("check_reverse", False),
+            jobs=options.get("jobs", 1),
         )
 
         # Optional result cache (--cache / --cache-file). Opt-in; namespaced by
@@ -414,6 +389,7 @@ class Command(BaseCommand):
                         migration=migration,
                         app_label=app_label,
                         migration_name=migration_name,
+                        loader=analyzer.get_loader(),
                     )
                 )
         elif new_only:
@@ -490,7 +466,7 @@ class Command(BaseCommand):
             reporter = get_reporter(output_format, **reporter_kwargs)
 
             # Generate report
-            reporter.report(issues)
+            reporter.write_report(issues)
         finally:
             # Close file if we opened one
             if output_file:
@@ -500,11 +476,5 @@ class Command(BaseCommand):
                 )
 
         # Determine exit code
-        errors = [i for i in issues if i.severity == Severity.ERROR]
-        warnings = [i for i in issues if i.severity == Severity.WARNING]
-        promoted = [i for i in warnings if i.rule_id in warnings_as_errors]
-
-        if errors or promoted:
-            sys.exit(1)
-        elif warnings and fail_on_warning:
+        if MigrationAnalyzer.should_fail(issues, fail_on_warning, warnings_as_errors):
             sys.exit(1)
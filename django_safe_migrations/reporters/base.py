@@ -36,6 +36,18 @@ class BaseReporter(ABC):
         """
         raise NotImplementedError
 
+    def write_report(self, issues: list[Issue]) -> None:
+        """Write the report for the given issues to the output stream.
+
+        Use this instead of :meth:`report` when the returned string is not
+        needed. Reporters that can emit output incrementally override it;
+        by default it simply calls :meth:`report`.
+
+        Args:
+            issues: List of issues to report.
+        """
+        self.report(issues)
+
     def write(self, content: str) -> None:
         """Write content to the output stream.
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, TextIO
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, TextIO
 
 from django_safe_migrations.reporters.base import BaseReporter
 from django_safe_migrations.rules.base import Severity
@@ -11,6 +12,19 @@ from django_safe_migrations.rules.base import Severity
 if TYPE_CHECKING:
     from django_safe_migrations.rules.base import Issue
 
+_UNICODE_ENCODINGS = frozenset({"utf8", "utf16", "utf32"})
+
+
+@lru_cache(maxsize=None)
+def _is_unicode_encoding(encoding: str) -> bool:
+    """Return True if *encoding* (e.g. ``"UTF-8"``) is a Unicode encoding.
+
+    Memoized: the stream encoding rarely changes within a process, but
+    sys.stdout is still re-read for every reporter, so swapped or captured
+    streams are classified correctly.
+    """
+    return encoding.lower().replace("-", "") in _UNICODE_ENCODINGS
+
 
 class ConsoleReporter(BaseReporter):
     """Reporter that outputs issues to the console with colors.
@@ -29,6 +43,7 @@ class ConsoleReporter(BaseReporter):
         "green": "\033[92m",
         "gray": "\033[90m",
     }
+    _NO_COLORS = dict.fromkeys(COLORS, "")
 
     SEVERITY_COLORS = {
         Severity.ERROR: "red",
@@ -81,22 +96,44 @@ class ConsoleReporter(BaseReporter):
         else:
             self.use_unicode = use_unicode
 
+        # Rendered severity badges, keyed by (use_color, use_unicode) so
+        # toggling either flag after construction still takes effect.
+        self._badge_cache: dict[tuple[bool, bool], dict[Severity, str]] = {}
+
     @staticmethod
     def _detect_unicode_support() -> bool:
         """Detect if the terminal supports Unicode output."""
-        import locale
-
-        encoding = (
-            getattr(sys.stdout, "encoding", None) or locale.getpreferredencoding()
-        )
-        return encoding.lower().replace("-", "") in ("utf8", "utf16", "utf32")
+        encoding = getattr(sys.stdout, "encoding", None)
+        if not encoding:
+            import locale
+
+            encoding = locale.getpreferredencoding()
+        return _is_unicode_encoding(encoding)
+
+    def _severity_badges(self) -> dict[Severity, str]:
+        """Return the colored ``"<symbol> <SEVERITY>"`` badge per severity."""
+        key = (self.use_color, self.use_unicode)
+        badges = self._badge_cache.get(key)
+        if badges is None:
+            symbols = (
+                self.SEVERITY_SYMBOLS_UNICODE
+                if self.use_unicode
+                else self.SEVERITY_SYMBOLS
+            )
+            badges = {
+                severity: self._color(
+                    f"{symbols[severity]} {severity.value.upper()}",
+                    self.SEVERITY_COLORS[severity],
+                )
+                for severity in Severity
+            }
+            self._badge_cache[key] = badges
+        return badges
 
     @property
-    def _symbols(self) -> dict[Severity, str]:
-        """Return the appropriate symbol set based on Unicode support."""
-        if self.use_unicode:
-            return self.SEVERITY_SYMBOLS_UNICODE
-        return self.SEVERITY_SYMBOLS
+    def _palette(self) -> dict[str, str]:
+        """Return the ANSI codes to use, or empty strings when color is off."""
+        return self.COLORS if self.use_color else self._NO_COLORS
 
     def _color(self, text: str, color: str) -> str:
         """Apply ANSI color to text.
@@ -115,60 +152,50 @@ class ConsoleReporter(BaseReporter):
     def _format_issue(self, issue: Issue) -> str:
         """Format a single issue for display.
 
+        The optional parts are built up front and the issue is rendered
+        with a single f-string, looking the color codes up once.
+
         Args:
             issue: The issue to format.
 
         Returns:
             Formatted string.
         """
-        lines = []
+        palette = self._palette
+        reset = palette["reset"]
+        gray = palette["gray"]
 
         # Build location string
-        location_parts = []
-        if issue.app_label:
-            location_parts.append(issue.app_label)
-        if issue.migration_name:
-            location_parts.append(issue.migration_name)
-        location = "/".join(location_parts) if location_parts else ""
-
         if issue.file_path:
-            file_location = issue.file_path
+            location = issue.file_path
             if issue.line_number:
-                file_location += f":{issue.line_number}"
-            location = file_location
-
-        # Severity color and symbol
-        color = self.SEVERITY_COLORS.get(issue.severity, "reset")
-        symbol = self._symbols.get(issue.severity, "*")
-
-        # Main line
-        severity_badge = self._color(f"{symbol} {issue.severity.value.upper()}", color)
-        rule_id = self._color(f"[{issue.rule_id}]", "cyan")
-
-        if location:
-            location_str = self._color(location, "gray")
-            lines.append(f"{severity_badge} {rule_id} {location_str}")
+                location += f":{issue.line_number}"
         else:
-            lines.append(f"{severity_badge} {rule_id}")
-
-        # Message
-        lines.append(f"   {issue.message}")
+            location = "/".join(
+                part for part in (issue.app_label, issue.migration_name) if part
+            )
+        location_str = f" {gray}{location}{reset}" if location else ""
 
-        # Operation
-        if issue.operation:
-            op_str = self._color(f"   Operation: {issue.operation}", "gray")
-            lines.append(op_str)
+        operation_str = (
+            f"\n{gray}   Operation: {issue.operation}{reset}" if issue.operation else ""
+        )
 
         # Suggestion (indented)
+        suggestion_str = ""
         if self.show_suggestions and issue.suggestion:
-            lines.append("")
             hint = "\U0001f4a1" if self.use_unicode else "*"
-            suggestion_header = self._color(f"   {hint} Suggestion:", "green")
-            lines.append(suggestion_header)
-            for line in issue.suggestion.strip().split("\n"):
-                lines.append(f"      {line}")
+            body = "\n".join(
+                f"      {line}" for line in issue.suggestion.strip().split("\n")
+            )
+            suggestion_str = (
+                f"\n\n{palette['green']}   {hint} Suggestion:{reset}\n{body}"
+            )
 
-        return "\n".join(lines)
+        return (
+            f"{self._severity_badges()[issue.severity]} "
+            f"{palette['cyan']}[{issue.rule_id}]{reset}{location_str}\n"
+            f"   {issue.message}{operation_str}{suggestion_str}"
+        )
 
     def report(self, issues: list[Issue]) -> str:
         """Generate a console report for the issues.
@@ -180,34 +207,68 @@ class ConsoleReporter(BaseReporter):
             The formatted report.
         """
         if not issues:
-            check = "\u2713" if self.use_unicode else "*"
-            output = self._color(f"{check} No migration issues found!", "green")
-            self.write(output)
-            return output
+            return self._report_no_issues()
 
-        lines = []
+        groups = self._group_by_severity(issues)
+        output = "".join(self._iter_issue_blocks(len(issues), groups))
+        output += self._format_summary(groups)
+        self.write(output)
+        return output
 
-        # Header
-        header = self._color(
-            f"Found {len(issues)} migration issue(s):",
-            "bold",
-        )
-        lines.append(header)
-        lines.append("")
+    def write_report(self, issues: list[Issue]) -> None:
+        """Write the console report one issue at a time.
 
-        # Group by severity for display order
-        errors = [i for i in issues if i.severity == Severity.ERROR]
-        warnings = [i for i in issues if i.severity == Severity.WARNING]
-        infos = [i for i in issues if i.severity == Severity.INFO]
+        Produces the same output as :meth:`report` without holding the
+        whole report in memory.
+
+        Args:
+            issues: List of issues to report.
+        """
+        if not issues:
+            self._report_no_issues()
+            return
+
+        groups = self._group_by_severity(issues)
+        if self.stream:
+            self.stream.writelines(self._iter_issue_blocks(len(issues), groups))
+        self.write(self._format_summary(groups))
+
+    def _report_no_issues(self) -> str:
+        """Write and return the message shown when nothing was found."""
+        check = "\u2713" if self.use_unicode else "*"
+        output = self._color(f"{check} No migration issues found!", "green")
+        self.write(output)
+        return output
 
-        for issue_group in [errors, warnings, infos]:
-            for issue in issue_group:
-                lines.append(self._format_issue(issue))
-                lines.append("")  # Blank line between issues
+    @staticmethod
+    def _group_by_severity(issues: list[Issue]) -> dict[Severity, list[Issue]]:
+        """Group issues by severity, in one pass."""
+        by_severity: dict[Severity, list[Issue]] = {sev: [] for sev in Severity}
+        for issue in issues:
+            by_severity[issue.severity].append(issue)
+        return by_severity
+
+    def _iter_issue_blocks(
+        self, total: int, groups: dict[Severity, list[Issue]]
+    ) -> Iterator[str]:
+        """Yield the header and then each issue, errors first.
+
+        Every block ends with a newline, so blocks can be written to a
+        Django ``OutputWrapper`` without it appending line endings.
+        """
+        yield self._color(f"Found {total} migration issue(s):", "bold") + "\n\n"
+        for severity in (Severity.ERROR, Severity.WARNING, Severity.INFO):
+            for issue in groups[severity]:
+                # Blank line between issues
+                yield self._format_issue(issue) + "\n\n"
+
+    def _format_summary(self, groups: dict[Severity, list[Issue]]) -> str:
+        """Format the separator and per-severity summary line."""
+        errors = groups[Severity.ERROR]
+        warnings = groups[Severity.WARNING]
+        infos = groups[Severity.INFO]
 
-        # Summary
         separator = "\u2500" if self.use_unicode else "-"
-        lines.append(self._color(separator * 50, "gray"))
         summary_parts = []
         if errors:
             summary_parts.append(self._color(f"{len(errors)} error(s)", "red"))
@@ -216,8 +277,8 @@ class ConsoleReporter(BaseReporter):
         if infos:
             summary_parts.append(self._color(f"{len(infos)} info", "blue"))
 
-        lines.append("Summary: " + ", ".join(summary_parts))
-
-        output = "\n".join(lines)
-        self.write(output)
-        return output
+        return (
+            self._color(separator * 50, "gray")
+            + "\nSummary: "
+            + ", ".join(summary_parts)
+        )
@@ -110,8 +110,12 @@ class GitHubReporter(BaseReporter):
             lines.append("::endgroup::")
 
             # Summary
-            errors = sum(1 for i in issues if i.severity == Severity.ERROR)
-            warnings = sum(1 for i in issues if i.severity == Severity.WARNING)
+            errors = warnings = 0
+            for issue in issues:
+                if issue.severity is Severity.ERROR:
+                    errors += 1
+                elif issue.severity is Severity.WARNING:
+                    warnings += 1
 
             if errors:
                 lines.append(
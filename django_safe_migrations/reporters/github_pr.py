@@ -72,18 +72,20 @@ class GitHubPRReporter(BaseReporter):
             self.write(output)
             return output
 
-        errors = sum(1 for i in issues if i.severity.value == "error")
-        warnings = sum(1 for i in issues if i.severity.value == "warning")
-        infos = sum(1 for i in issues if i.severity.value == "info")
-
-        # Group issues by migration file (preserving a stable order).
+        # Count by severity and group by migration file in one pass.
+        counts = dict.fromkeys(_SEVERITY_ORDER, 0)
         by_file: dict[str, list[Issue]] = {}
         for issue in issues:
+            counts[issue.severity.value] += 1
             key = issue.file_path or "(unknown migration)"
             by_file.setdefault(key, []).append(issue)
 
         lines: list[str] = [f"## {_TITLE}", ""]
-        lines.append(self._summary_line(len(issues), errors, warnings, infos))
+        lines.append(
+            self._summary_line(
+                len(issues), counts["error"], counts["warning"], counts["info"]
+            )
+        )
         lines.append("")
 
         for file_path in sorted(by_file):
@@ -18,6 +18,16 @@ from django_safe_migrations.reporters.base import BaseReporter
 if TYPE_CHECKING:
     from django_safe_migrations.rules.base import Issue
 
+# orjson is optional (the ``fast`` extra); it serialises large reports
+# considerably faster than the stdlib. It emits UTF-8 bytes, so it is only
+# used for streams that expose a binary buffer to write them to.
+_HAS_ORJSON = False
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Map our severity levels to GitLab Code Quality severity
 _SEVERITY_MAP = {
@@ -26,6 +36,10 @@ _SEVERITY_MAP = {
     "info": "minor",
 }
 
+# Shared by every entry; a tuple so no entry can mutate it for the others.
+# Both json and orjson serialise tuples as arrays.
+_CATEGORIES = ("Migration Safety",)
+
 
 class GitLabReporter(BaseReporter):
     """Reporter that outputs issues in GitLab Code Quality JSON format."""
@@ -47,11 +61,19 @@ class GitLabReporter(BaseReporter):
         Returns:
             The JSON report as a string.
         """
-        entries: list[dict[str, Any]] = []
-
-        for issue in issues:
-            entry = self._issue_to_entry(issue)
-            entries.append(entry)
+        to_entry = self._issue_to_entry
+        entries = [to_entry(issue) for issue in issues]
+
+        buffer = getattr(self.stream, "buffer", None) if _HAS_ORJSON else None
+        if buffer is not None:
+            data = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+            # Bypass the text layer, whose encoding may not cover non-ASCII
+            # messages; flush it first so earlier output stays in order.
+            self.stream.flush()
+            buffer.write(data)
+            buffer.write(b"\n")
+            buffer.flush()
+            return data.decode()
 
         output = json.dumps(entries, indent=2)
         self.write(output)
@@ -75,8 +97,11 @@ class GitLabReporter(BaseReporter):
             f"{issue.rule_id}:{issue.app_label}:{issue.migration_name}:"
             f"{issue.operation}:{issue.line_number}:{issue.message}"
         )
-        fingerprint = hashlib.md5(  # noqa: S324  # nosec B324
-            fingerprint_source.encode()
+        # Fingerprints only need to be stable, not cryptographic; BLAKE2b
+        # is quicker than MD5 on short inputs and is still available when
+        # OpenSSL runs in FIPS mode. 16 bytes keeps the 32-character form.
+        fingerprint = hashlib.blake2b(
+            fingerprint_source.encode(), digest_size=16
         ).hexdigest()
 
         severity = _SEVERITY_MAP.get(issue.severity.value, "info")
@@ -85,7 +110,7 @@ class GitLabReporter(BaseReporter):
             "type": "issue",
             "check_name": issue.rule_id,
             "description": issue.message,
-            "categories": ["Migration Safety"],
+            "categories": _CATEGORIES,
             "severity": severity,
             "fingerprint": fingerprint,
             "location": {
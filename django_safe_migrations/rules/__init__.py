@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from django_safe_migrations.rules.add_field import (
     AddFieldWithDefaultRule,
@@ -136,6 +137,8 @@ __all__ = [
     "get_all_rule_ids",
     "get_rule_by_id",
     "clear_extra_rules_cache",
+    "get_rules_info",
+    "format_rules_listing",
 ]
 
 # Registry of all available rules
@@ -203,6 +206,10 @@ logger = logging.getLogger("django_safe_migrations")
 # Cache for loaded extra rules to avoid repeated imports
 _extra_rules_cache: list[type[BaseRule]] | None = None
 
+# Instantiated rules per database vendor. Rules hold no per-check state, so
+# one set of instances is shared by every analyzer for that vendor.
+_rules_by_vendor: dict[str, tuple[BaseRule, ...]] = {}
+
 
 def _load_extra_rules() -> list[type[BaseRule]]:
     """Load custom rules from EXTRA_RULES configuration.
@@ -258,12 +265,13 @@ def _load_extra_rules() -> list[type[BaseRule]]:
 
 
 def clear_extra_rules_cache() -> None:
-    """Clear the extra rules cache.
+    """Clear the extra rules cache and the per-vendor rule instances.
 
     This is useful for testing or when configuration changes.
     """
     global _extra_rules_cache
     _extra_rules_cache = None
+    _rules_by_vendor.clear()
 
 
 def get_all_rules(db_vendor: str = "postgresql") -> list[BaseRule]:
@@ -272,12 +280,23 @@ def get_all_rules(db_vendor: str = "postgresql") -> list[BaseRule]:
     This includes both built-in rules and any custom rules configured
     via EXTRA_RULES in settings.
 
+    Rule instances are created once per vendor and reused; each call
+    returns a new list, so callers may add or remove rules freely.
+
     Args:
         db_vendor: The database vendor (e.g., 'postgresql', 'mysql').
 
     Returns:
         A list of instantiated rule objects.
     """
+    cached = _rules_by_vendor.get(db_vendor)
+    if cached is None:
+        cached = _rules_by_vendor[db_vendor] = tuple(_instantiate_rules(db_vendor))
+    return list(cached)
+
+
+def _instantiate_rules(db_vendor: str) -> list[BaseRule]:
+    """Instantiate the built-in and EXTRA_RULES rules that apply to a vendor."""
     rules = []
 
     # Load built-in rules
@@ -360,3 +379,54 @@ def get_rule_by_id(rule_id: str) -> type[BaseRule] | None:
             pass  # Skip rules that fail to instantiate
 
     return None
+
+
+def get_rules_info() -> list[dict[str, Any]]:
+    """Describe every available rule for ``--list-rules``.
+
+    Covers both built-in rules and custom rules from EXTRA_RULES, in that
+    order. Shared by the standalone CLI and the management command.
+
+    Returns:
+        One dict per rule with ``rule_id``, ``severity`` (its value),
+        ``description``, ``categories`` and ``db_vendors`` (``["all"]`` when
+        the rule is vendor-agnostic).
+    """
+    from django_safe_migrations.conf import get_category_for_rule
+
+    rules_data = []
+    for rule_cls in list(ALL_RULES) + _load_extra_rules():
+        rule = rule_cls()
+        rules_data.append(
+            {
+                "rule_id": rule.rule_id,
+                "severity": rule.severity.value,
+                "description": rule.description,
+                "categories": get_category_for_rule(rule.rule_id),
+                "db_vendors": rule.db_vendors if rule.db_vendors else ["all"],
+            }
+        )
+    return rules_data
+
+
+def format_rules_listing(rules_data: list[dict[str, Any]]) -> list[str]:
+    """Render :func:`get_rules_info` output as console lines.
+
+    Args:
+        rules_data: Rule descriptions from :func:`get_rules_info`.
+
+    Returns:
+        The lines of the human-readable rules listing.
+    """
+    lines = ["Available Rules:", "-" * 80]
+    for rule_info in rules_data:
+        severity_str = str(rule_info["severity"]).upper()
+        categories_str = ", ".join(rule_info["categories"]) or "none"
+        db_str = ", ".join(rule_info["db_vendors"])
+        lines.append(
+            f"{rule_info['rule_id']} [{severity_str}] {rule_info['description']}"
+        )
+        lines.append(f"    Categories: {categories_str}")
+        lines.append(f"    Databases: {db_str}")
+        lines.append("")
+    return lines
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Optional
 
+import django
+from django.conf import settings
 from django.db import migrations
+from django.db.models.fields import NOT_PROVIDED, Field
 
 from django_safe_migrations.rules.base import BaseRule, Issue, Severity
 
@@ -15,6 +19,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("django_safe_migrations")
 
+try:
+    from django.db.models import GeneratedField
+except ImportError:  # Django < 5.0
+    GeneratedField = None  # type: ignore[assignment,misc]
+
 
 class NotNullWithoutDefaultRule(BaseRule):
     """Detect adding NOT NULL column without a default value.
@@ -34,6 +43,16 @@ class NotNullWithoutDefaultRule(BaseRule):
     rule_id = "SM001"
     severity = Severity.ERROR
     description = "Adding NOT NULL column without default will lock table"
+    operation_types = (migrations.AddField,)
+
+    # Auto-incrementing field types; the database fills these itself
+    AUTO_FIELD_TYPES = frozenset(
+        {
+            "AutoField",
+            "BigAutoField",
+            "SmallAutoField",
+        }
+    )
 
     def check(
         self,
@@ -56,63 +75,54 @@ class NotNullWithoutDefaultRule(BaseRule):
 
         field = operation.field
 
-        # Check if field is NOT NULL (null=False is default)
-        is_not_null = not getattr(field, "null", False)
+        # Each check below marks the field safe; the cheapest and most
+        # common (nullable, or given a default) come first.
 
-        # Check if field has a default - Django uses NOT_PROVIDED sentinel
-        from django.db.models.fields import NOT_PROVIDED
+        # Nullable fields need no value for existing rows
+        if getattr(field, "null", False):
+            return None
 
-        default_value = getattr(field, "default", NOT_PROVIDED)
-        has_default = default_value is not NOT_PROVIDED
+        # Check if field has a default - Django uses NOT_PROVIDED sentinel
+        if getattr(field, "default", NOT_PROVIDED) is not NOT_PROVIDED:
+            return None
 
-        # Also check has_default() method if available
-        if not has_default and hasattr(field, "has_default"):
-            has_default = field.has_default()
+        # Custom fields may override has_default(); Django's own version
+        # only repeats the sentinel check above, so it is not called.
+        has_default = getattr(type(field), "has_default", None)
+        if (
+            has_default is not None
+            and has_default is not Field.has_default
+            and field.has_default()
+        ):
+            return None
 
-        # Check for db_default (Django 5.0+)
+        # Check for db_default (Django 5.0+), which also uses NOT_PROVIDED
         db_default = getattr(field, "db_default", None)
-        if db_default is not None:
-            # db_default uses a sentinel NOT_PROVIDED value in Django 5.0+
-            try:
-                from django.db.models.fields import NOT_PROVIDED as DB_NOT_PROVIDED
-
-                if db_default is not DB_NOT_PROVIDED:
-                    has_default = True
-            except ImportError:
-                # Pre-Django 5.0, db_default doesn't exist
-                has_default = True
+        if db_default is not None and db_default is not NOT_PROVIDED:
+            return None
 
         # Primary keys and auto fields are OK
-        is_auto = getattr(field, "primary_key", False) or field.__class__.__name__ in (
-            "AutoField",
-            "BigAutoField",
-            "SmallAutoField",
-        )
+        if (
+            getattr(field, "primary_key", False)
+            or field.__class__.__name__ in self.AUTO_FIELD_TYPES
+        ):
+            return None
 
         # OneToOneField and ForeignKey with db_constraint=False are special
-        is_relation_no_constraint = hasattr(field, "db_constraint") and not getattr(
+        if hasattr(field, "db_constraint") and not getattr(
             field, "db_constraint", True
-        )
-
-        if (
-            is_not_null
-            and not has_default
-            and not is_auto
-            and not is_relation_no_constraint
         ):
-            model_name = getattr(operation, "model_name", "unknown")
-            field_name = getattr(operation, "name", "unknown")
-
-            return self.create_issue(
-                operation=operation,
-                message=(
-                    f"Adding NOT NULL field '{field_name}' to '{model_name}' "
-                    f"without a default value will lock the table"
-                ),
-                migration=migration,
-            )
+            return None
 
-        return None
+        return self.create_issue(
+            operation=operation,
+            message=(
+                f"Adding NOT NULL field '{operation.name}' to "
+                f"'{operation.model_name}' "
+                f"without a default value will lock the table"
+            ),
+            migration=migration,
+        )
 
     def get_suggestion(self, operation: Operation) -> str:
         """Return the suggested fix for this operation.
@@ -171,6 +181,7 @@ class ExpensiveDefaultCallableRule(BaseRule):
     rule_id = "SM022"
     severity = Severity.WARNING
     description = "Callable default may be slow for large table backfills"
+    operation_types = (migrations.AddField,)
 
     # Callables that are known to be fast
     FAST_CALLABLES = frozenset(
@@ -194,6 +205,16 @@ class ExpensiveDefaultCallableRule(BaseRule):
         }
     )
 
+    @cached_property
+    def _callable_is_slow(self) -> dict[str, bool]:
+        """Map each known callable name to True (slow) or False (fast).
+
+        Fast entries win, as a name in both sets is treated as fast.
+        """
+        speeds = dict.fromkeys(self.SLOW_CALLABLES, True)
+        speeds.update(dict.fromkeys(self.FAST_CALLABLES, False))
+        return speeds
+
     def check(
         self,
         operation: Operation,
@@ -216,8 +237,6 @@ class ExpensiveDefaultCallableRule(BaseRule):
         field = operation.field
 
         # Check if field has a default
-        from django.db.models.fields import NOT_PROVIDED
-
         default_value = getattr(field, "default", NOT_PROVIDED)
 
         if default_value is NOT_PROVIDED:
@@ -227,21 +246,23 @@ class ExpensiveDefaultCallableRule(BaseRule):
         if not callable(default_value):
             return None
 
-        # Get the callable's name for checking
+        # Look the callable up by name (exact match only). A known-fast
+        # short name such as "uuid4" settles it; otherwise the qualified
+        # name can still mark it fast or slow.
+        callable_is_slow = self._callable_is_slow
         callable_name = getattr(default_value, "__name__", "")
-        callable_module = getattr(default_value, "__module__", "")
-        full_name = (
-            f"{callable_module}.{callable_name}" if callable_module else callable_name
-        )
-
-        # Skip if it's a known fast callable
-        if callable_name in self.FAST_CALLABLES or full_name in self.FAST_CALLABLES:
-            return None
-
-        # Check if it's a known slow callable (exact match only)
-        is_slow = (
-            callable_name in self.SLOW_CALLABLES or full_name in self.SLOW_CALLABLES
-        )
+        is_slow = callable_is_slow.get(callable_name)
+        if is_slow is not False:
+            callable_module = getattr(default_value, "__module__", "")
+            full_name = (
+                f"{callable_module}.{callable_name}"
+                if callable_module
+                else callable_name
+            )
+            full_is_slow = callable_is_slow.get(full_name)
+            if full_is_slow is False:
+                return None
+            is_slow = is_slow or full_is_slow
 
         if is_slow:
             return self.create_issue(
@@ -334,6 +355,7 @@ class PreferBigIntRule(BaseRule):
     rule_id = "SM028"
     severity = Severity.WARNING
     description = "Prefer BigAutoField/BigIntegerField over 32-bit primary keys"
+    operation_types = (migrations.AddField, migrations.CreateModel)
 
     # 32-bit auto/int field types that may overflow as primary keys
     SMALL_PK_TYPES = frozenset(
@@ -381,22 +403,31 @@ class PreferBigIntRule(BaseRule):
 
         # Check CreateModel for pk fields in the fields list
         if isinstance(operation, migrations.CreateModel):
-            model_name = getattr(operation, "name", "unknown")
-            fields = getattr(operation, "fields", [])
-            for field_name, field in fields:
-                field_type = field.__class__.__name__
-                is_pk = getattr(field, "primary_key", False)
-                if is_pk and field_type in self.SMALL_PK_TYPES:
-                    return self.create_issue(
-                        operation=operation,
-                        migration=migration,
-                        message=(
-                            f"Field '{field_name}' on '{model_name}' uses "
-                            f"{field_type} as primary key. Consider using "
-                            "BigAutoField/BigIntegerField to avoid overflow "
-                            "at ~2.1 billion rows."
-                        ),
-                    )
+            # A model has at most one primary key, so only that field
+            # needs its type checked.
+            pk = next(
+                (
+                    (field_name, field)
+                    for field_name, field in operation.fields
+                    if getattr(field, "primary_key", False)
+                ),
+                None,
+            )
+            if pk is None:
+                return None
+            field_name, field = pk
+            field_type = field.__class__.__name__
+            if field_type in self.SMALL_PK_TYPES:
+                return self.create_issue(
+                    operation=operation,
+                    migration=migration,
+                    message=(
+                        f"Field '{field_name}' on '{operation.name}' uses "
+                        f"{field_type} as primary key. Consider using "
+                        "BigAutoField/BigIntegerField to avoid overflow "
+                        "at ~2.1 billion rows."
+                    ),
+                )
 
         return None
 
@@ -435,6 +466,7 @@ class PreferTextOverVarcharRule(BaseRule):
     severity = Severity.INFO
     description = "Consider using TextField instead of CharField on PostgreSQL"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.AddField,)
 
     def check(
         self,
@@ -516,6 +548,7 @@ class PreferTimestampTZRule(BaseRule):
     rule_id = "SM032"
     severity = Severity.INFO
     description = "DateTimeField with USE_TZ=False stores naive datetimes"
+    operation_types = (migrations.AddField,)
 
     def check(
         self,
@@ -542,8 +575,6 @@ class PreferTimestampTZRule(BaseRule):
         if field_type != "DateTimeField":
             return None
 
-        from django.conf import settings
-
         if getattr(settings, "USE_TZ", True):
             return None
 
@@ -599,6 +630,7 @@ class AddFieldWithDefaultRule(BaseRule):
     rule_id = "SM033"
     severity = Severity.WARNING
     description = "Adding NOT NULL field with default rewrites all existing rows"
+    operation_types = (migrations.AddField,)
 
     # Auto fields don't need this check
     AUTO_FIELD_TYPES = frozenset(
@@ -640,8 +672,6 @@ class AddFieldWithDefaultRule(BaseRule):
             return None
 
         # Check if field has a default
-        from django.db.models.fields import NOT_PROVIDED
-
         default_value = getattr(field, "default", NOT_PROVIDED)
         if default_value is NOT_PROVIDED:
             return None
@@ -719,6 +749,7 @@ class PreferIdentityRule(BaseRule):
     severity = Severity.INFO
     description = "Consider IDENTITY columns instead of SERIAL on PostgreSQL"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.AddField,)
 
     AUTO_FIELD_TYPES = frozenset(
         {
@@ -744,8 +775,6 @@ class PreferIdentityRule(BaseRule):
         Returns:
             An Issue if Django < 4.0 and using auto fields.
         """
-        import django
-
         if django.VERSION >= (4, 0):
             return None
 
@@ -807,6 +836,7 @@ class VolatileDefaultWithUniqueRule(BaseRule):
     rule_id = "SM040"
     severity = Severity.ERROR
     description = "Unique field with a callable default fails on populated tables"
+    operation_types = (migrations.AddField,)
 
     def check(
         self,
@@ -822,8 +852,6 @@ class VolatileDefaultWithUniqueRule(BaseRule):
         if not getattr(field, "unique", False):
             return None
 
-        from django.db.models.fields import NOT_PROVIDED
-
         default = getattr(field, "default", NOT_PROVIDED)
         if default is NOT_PROVIDED or not callable(default):
             return None
@@ -853,6 +881,7 @@ class AddStoredGeneratedFieldRule(BaseRule):
     severity = Severity.WARNING
     description = "Adding a stored GeneratedField rewrites the whole table"
     django_min_version = (5, 0)
+    operation_types = (migrations.AddField,)
 
     def check(
         self,
@@ -861,12 +890,7 @@ class AddStoredGeneratedFieldRule(BaseRule):
         **kwargs: object,
     ) -> Optional[Issue]:
         """Flag AddField of a GeneratedField with db_persist=True."""
-        if not isinstance(operation, migrations.AddField):
-            return None
-
-        try:
-            from django.db.models import GeneratedField
-        except ImportError:  # Django < 5.0
+        if GeneratedField is None or not isinstance(operation, migrations.AddField):
             return None
 
         field = operation.field
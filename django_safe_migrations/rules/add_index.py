@@ -34,6 +34,7 @@ class UnsafeIndexCreationRule(BaseRule):
     severity = Severity.ERROR
     description = "Index creation without CONCURRENTLY will lock table"
     db_vendors = ["postgresql"]  # Only applies to PostgreSQL
+    operation_types = (migrations.AddIndex,)
 
     def check(
         self,
@@ -141,6 +142,7 @@ class UnsafeUniqueConstraintRule(BaseRule):
     severity = Severity.ERROR
     description = "Unique constraint without concurrent index will lock table"
     db_vendors = ["postgresql"]  # Only applies to PostgreSQL
+    operation_types = (migrations.AddConstraint,)
 
     def check(
         self,
@@ -255,6 +257,9 @@ class ConcurrentInAtomicMigrationRule(BaseRule):
     severity = Severity.ERROR
     description = "Concurrent operations require atomic = False"
     db_vendors = ["postgresql"]
+    # The concurrent operations subclass AddIndex / RemoveIndex; naming the
+    # bases avoids importing django.contrib.postgres (which needs psycopg).
+    operation_types = (migrations.AddIndex, migrations.RemoveIndex)
 
     # Concurrent operation class names to detect
     CONCURRENT_OPERATIONS = frozenset(
@@ -359,6 +364,7 @@ class UnsafeIndexDeletionRule(BaseRule):
     severity = Severity.ERROR
     description = "Index removal without CONCURRENTLY will lock table"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.RemoveIndex,)
 
     def check(
         self,
@@ -44,6 +44,7 @@ class AlterColumnTypeRule(BaseRule):
     rule_id = "SM004"
     severity = Severity.WARNING
     description = "Changing column type may rewrite table and lock it"
+    operation_types = (migrations.AlterField,)
 
     def check(
         self,
@@ -65,7 +66,6 @@ class AlterColumnTypeRule(BaseRule):
             return None
 
         field = operation.field
-        field_type = field.__class__.__name__
         old_field = kwargs.get("old_field")
 
         # If we have the old field state, do precise comparison
@@ -94,7 +94,8 @@ class AlterColumnTypeRule(BaseRule):
             migration=migration,
             message=(
                 f"Altering field '{operation.name}' on '{operation.model_name}' "
-                f"to type '{field_type}' may require table rewrite and lock"
+                f"to type '{type(field).__name__}' may require table rewrite "
+                "and lock"
             ),
         )
 
@@ -249,6 +250,11 @@ class AddForeignKeyValidatesRule(BaseRule):
     severity = Severity.WARNING
     description = "Adding foreign key validates existing rows (may lock table)"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.AddField,)
+
+    # Matched by class name, like the add_field rules, so project
+    # subclasses that keep Django's class name are flagged too.
+    FOREIGN_KEY_TYPES = frozenset({"ForeignKey", "OneToOneField"})
 
     def check(
         self,
@@ -270,10 +276,9 @@ class AddForeignKeyValidatesRule(BaseRule):
             return None
 
         field = operation.field
-        field_type = field.__class__.__name__
 
         # Check if it's a ForeignKey or OneToOneField
-        if field_type not in ("ForeignKey", "OneToOneField"):
+        if type(field).__name__ not in self.FOREIGN_KEY_TYPES:
             return None
 
         # Check if db_constraint is True (default)
@@ -350,6 +355,7 @@ class RenameColumnRule(BaseRule):
     rule_id = "SM006"
     severity = Severity.INFO
     description = "Column rename may break code during deployment"
+    operation_types = (migrations.RenameField,)
 
     def check(
         self,
@@ -442,6 +448,7 @@ class AlterVarcharLengthRule(BaseRule):
     severity = Severity.WARNING
     description = "Decreasing VARCHAR length requires table rewrite"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.AlterField,)
 
     def check(
         self,
@@ -463,10 +470,9 @@ class AlterVarcharLengthRule(BaseRule):
             return None
 
         field = operation.field
-        field_type = field.__class__.__name__
 
         # Only check CharField (which uses VARCHAR)
-        if field_type != "CharField":
+        if type(field).__name__ != "CharField":
             return None
 
         new_max_length = getattr(field, "max_length", None)
@@ -476,12 +482,11 @@ class AlterVarcharLengthRule(BaseRule):
         old_field = kwargs.get("old_field")
 
         if old_field is not None:
-            old_type = old_field.__class__.__name__
             old_max_length = getattr(old_field, "max_length", None)
 
             # Changing from non-CharField to CharField is a type change
             # (handled by SM004), not a length change
-            if old_type != "CharField":
+            if type(old_field).__name__ != "CharField":
                 return None
 
             # If old max_length is known, only warn on decrease
@@ -579,6 +584,7 @@ class RenameModelRule(BaseRule):
     rule_id = "SM014"
     severity = Severity.WARNING
     description = "Renaming model may break foreign keys and references"
+    operation_types = (migrations.RenameModel,)
 
     def check(
         self,
@@ -677,6 +683,7 @@ class AlterFieldNullFalseRule(BaseRule):
     rule_id = "SM020"
     severity = Severity.ERROR
     description = "Changing field to NOT NULL may fail if NULL values exist"
+    operation_types = (migrations.AlterField,)
 
     def check(
         self,
@@ -788,6 +795,7 @@ class AlterFieldUniqueRule(BaseRule):
     severity = Severity.ERROR
     description = "Adding unique=True via AlterField locks table during index creation"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.AlterField,)
 
     def check(
         self,
@@ -897,6 +905,7 @@ class DropNotNullRule(BaseRule):
     rule_id = "SM029"
     severity = Severity.WARNING
     description = "Dropping NOT NULL constraint may allow unintended NULL values"
+    operation_types = (migrations.AlterField,)
 
     def check(
         self,
@@ -998,6 +1007,7 @@ class AlterCompositePrimaryKeyRule(BaseRule):
     severity = Severity.ERROR
     description = "Migrating to a CompositePrimaryKey after table creation fails"
     django_min_version = (5, 2)
+    operation_types = (migrations.AddField, migrations.AlterField)
 
     def check(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -11,6 +12,13 @@ if TYPE_CHECKING:
     from django.db.migrations import Migration
     from django.db.migrations.operations.base import Operation
 
+# Issues are created in bulk and read in every reporter/baseline loop, so
+# they drop the per-instance __dict__. ``dataclass(slots=True)`` needs
+# Python 3.10+; on 3.9 Issue keeps a regular __dict__.
+_DATACLASS_SLOTS: dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 class Severity(Enum):
     """Severity levels for migration issues."""
@@ -20,7 +28,10 @@ class Severity(Enum):
     INFO = "info"  # Best practice recommendation
 
 
-@dataclass
+_SEVERITY_BY_VALUE: dict[str, Severity] = {s.value: s for s in Severity}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Issue:
     """Represents an issue found in a migration.
 
@@ -92,9 +103,13 @@ class Issue:
         Returns:
             The reconstructed :class:`Issue`.
         """
+        severity = _SEVERITY_BY_VALUE.get(data["severity"])
+        if severity is None:
+            # Fall through to the enum so unknown values still raise ValueError.
+            severity = Severity(data["severity"])
         return cls(
             rule_id=data["rule_id"],
-            severity=Severity(data["severity"]),
+            severity=severity,
             operation=data["operation"],
             message=data["message"],
             suggestion=data.get("suggestion"),
@@ -122,6 +137,10 @@ class BaseRule(ABC):
     db_vendors: list[str] = []  # Empty means all databases
     # Minimum Django version this rule applies to, e.g. (5, 0). None = all.
     django_min_version: Optional[tuple[int, ...]] = None
+    # Operation classes check() can flag. The analyzer only calls check()
+    # for operations that are instances of one of these. None = every
+    # operation; () = none (migration-level or graph-level rules).
+    operation_types: Optional[tuple[type, ...]] = None
 
     @abstractmethod
     def check(
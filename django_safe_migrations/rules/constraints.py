@@ -30,6 +30,7 @@ class AddUniqueConstraintRule(BaseRule):
     rule_id = "SM009"
     severity = Severity.ERROR
     description = "Adding unique constraint requires full table scan"
+    operation_types = (migrations.AddConstraint,)
 
     def check(
         self,
@@ -137,6 +138,7 @@ class AlterUniqueTogetherRule(BaseRule):
     rule_id = "SM015"
     severity = Severity.WARNING
     description = "AlterUniqueTogether is deprecated, use UniqueConstraint"
+    operation_types = (migrations.AlterUniqueTogether,)
 
     def check(
         self,
@@ -228,6 +230,7 @@ class AddCheckConstraintRule(BaseRule):
     severity = Severity.WARNING
     description = "Adding check constraint validates all existing rows"
     db_vendors = ["postgresql"]  # Most relevant for PostgreSQL
+    operation_types = (migrations.AddConstraint,)
 
     def check(
         self,
@@ -319,6 +322,7 @@ class AddExclusionConstraintRule(BaseRule):
     severity = Severity.WARNING
     description = "Adding an exclusion constraint scans the whole table"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.AddConstraint,)
 
     def check(
         self,
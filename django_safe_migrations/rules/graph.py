@@ -28,6 +28,7 @@ class MissingMergeMigrationRule(BaseRule):
     rule_id = "SM027"
     severity = Severity.ERROR
     description = "Multiple leaf migrations require a merge migration"
+    operation_types = ()
 
     def check(
         self,
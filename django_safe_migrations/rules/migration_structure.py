@@ -80,6 +80,7 @@ class MixedSchemaAndDataRule(BaseRule):
     rule_id = "SM038"
     severity = Severity.WARNING
     description = "Migration mixes schema changes with data operations"
+    operation_types = ()
 
     def check(
         self,
@@ -123,6 +124,7 @@ class MultipleHeavyOpsSameTableRule(BaseRule):
     rule_id = "SM054"
     severity = Severity.INFO
     description = "Several heavy schema operations on one table in a migration"
+    operation_types = ()
 
     def check(
         self,
@@ -342,6 +342,7 @@ class ReservedKeywordColumnRule(BaseRule):
     rule_id = "SM019"
     severity = Severity.INFO
     description = "Column name is a SQL reserved keyword"
+    operation_types = (migrations.AddField, migrations.CreateModel)
 
     def check(
         self,
@@ -28,6 +28,7 @@ class AddManyToManyRule(BaseRule):
     rule_id = "SM023"
     severity = Severity.INFO
     description = "Adding ManyToManyField creates a new junction table"
+    operation_types = (migrations.AddField,)
 
     def check(
         self,
@@ -111,6 +112,7 @@ class ForeignKeyWithoutIndexRule(BaseRule):
     rule_id = "SM025"
     severity = Severity.WARNING
     description = "ForeignKey with db_index=False may cause slow queries"
+    operation_types = (migrations.AddField,)
 
     def check(
         self,
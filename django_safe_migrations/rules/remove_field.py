@@ -30,6 +30,7 @@ class DropColumnUnsafeRule(BaseRule):
     rule_id = "SM002"
     severity = Severity.WARNING
     description = "Dropping column while old code may reference it"
+    operation_types = (migrations.RemoveField,)
 
     def check(
         self,
@@ -112,6 +113,7 @@ class DropTableUnsafeRule(BaseRule):
     rule_id = "SM003"
     severity = Severity.WARNING
     description = "Dropping table while old code may reference it"
+    operation_types = (migrations.DeleteModel,)
 
     def check(
         self,
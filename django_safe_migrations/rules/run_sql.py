@@ -55,6 +55,7 @@ class RunSQLWithoutReverseRule(BaseRule):
     rule_id = "SM007"
     severity = Severity.WARNING
     description = "RunSQL without reverse_sql cannot be rolled back"
+    operation_types = (migrations.RunSQL,)
 
     def check(
         self,
@@ -138,6 +139,7 @@ class EnumAddValueInTransactionRule(BaseRule):
     severity = Severity.ERROR
     description = "Adding enum value in transaction will fail in PostgreSQL"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.RunSQL,)
 
     # Patterns that indicate adding enum value. The type name may be
     # schema-qualified (myschema.my_enum) or double-quoted ("My Enum").
@@ -240,6 +242,7 @@ class LargeDataMigrationRule(BaseRule):
     rule_id = "SM008"
     severity = Severity.INFO
     description = "Data migration may be slow on large tables"
+    operation_types = (migrations.RunPython,)
 
     def check(
         self,
@@ -334,6 +337,7 @@ class RunPythonWithoutReverseRule(BaseRule):
     rule_id = "SM016"
     severity = Severity.INFO
     description = "RunPython without reverse_code cannot be rolled back"
+    operation_types = (migrations.RunPython,)
 
     def check(
         self,
@@ -429,6 +433,7 @@ class SQLInjectionPatternRule(BaseRule):
     rule_id = "SM024"
     severity = Severity.ERROR
     description = "Potential SQL injection pattern detected in RunSQL"
+    operation_types = (migrations.RunSQL,)
 
     # Patterns that suggest string interpolation (potential SQL injection)
     # Each pattern is checked against the SQL text of RunSQL operations
@@ -552,6 +557,7 @@ class RunPythonNoBatchingRule(BaseRule):
     rule_id = "SM026"
     severity = Severity.WARNING
     description = "RunPython may load all rows into memory without batching"
+    operation_types = (migrations.RunPython,)
 
     def check(
         self,
@@ -677,6 +683,7 @@ class RequireLockTimeoutRule(BaseRule):
     rule_id = "SM035"
     severity = Severity.INFO
     description = "RunSQL with DDL should set lock_timeout to avoid blocking"
+    operation_types = (migrations.RunSQL,)
 
     # DDL patterns that benefit from lock_timeout
     DDL_PATTERNS = [
@@ -795,6 +802,7 @@ class PreferIfExistsRule(BaseRule):
     rule_id = "SM036"
     severity = Severity.INFO
     description = "Use IF [NOT] EXISTS for defensive CREATE/DROP TABLE"
+    operation_types = (migrations.RunSQL,)
 
     def check(
         self,
@@ -895,6 +903,7 @@ class TruncateInRunSQLRule(BaseRule):
     rule_id = "SM048"
     severity = Severity.WARNING
     description = "TRUNCATE in a migration deletes all table data"
+    operation_types = (migrations.RunSQL,)
 
     def check(
         self,
@@ -932,6 +941,7 @@ class DropDatabaseInRunSQLRule(BaseRule):
     rule_id = "SM050"
     severity = Severity.ERROR
     description = "DROP DATABASE/SCHEMA in a migration is catastrophic"
+    operation_types = (migrations.RunSQL,)
 
     def check(
         self,
@@ -970,6 +980,7 @@ class TransactionNestingInRunSQLRule(BaseRule):
     rule_id = "SM049"
     severity = Severity.ERROR
     description = "Explicit transaction control in RunSQL conflicts with atomic"
+    operation_types = (migrations.RunSQL,)
 
     def check(
         self,
@@ -1018,6 +1029,7 @@ class ConstraintMissingNotValidRule(BaseRule):
     severity = Severity.WARNING
     description = "ADD CONSTRAINT (CHECK/FK) without NOT VALID scans the table"
     db_vendors = ["postgresql"]
+    operation_types = (migrations.RunSQL,)
 
     def check(
         self,
@@ -1078,6 +1090,7 @@ class DirectModelImportInRunPythonRule(BaseRule):
     rule_id = "SM037"
     severity = Severity.INFO
     description = "RunPython should use apps.get_model(), not a direct model import"
+    operation_types = (migrations.RunPython,)
 
     def check(
         self,
@@ -44,6 +44,8 @@ class Suppression:
         line_number: Line number where the suppression was found.
     """
 
+    __slots__ = ("rules", "reason", "line_number")
+
     rules: set[str]
     reason: Optional[str]
     line_number: int
@@ -146,6 +146,6 @@ def _default_analysis_callback() -> None:
         analyzer = MigrationAnalyzer()
         issues = analyzer.analyze_all()
         reporter = get_reporter("console", stream=sys.stdout)
-        reporter.report(issues)
+        reporter.write_report(issues)
     except Exception as e:
         print(f"Error during analysis: {e}", file=sys.stderr)
@@ -127,6 +127,70 @@ class TestNotNullWithoutDefaultRule:
 
         assert issue is None
 
+    def test_allows_foreign_key_without_db_constraint(self, mock_migration):
+        """Test that a NOT NULL ForeignKey with db_constraint=False is allowed."""
+        rule = NotNullWithoutDefaultRule()
+        operation = migrations.AddField(
+            model_name="article",
+            name="author",
+            field=models.ForeignKey(
+                to="auth.User",
+                on_delete=models.CASCADE,
+                db_constraint=False,
+            ),
+        )
+
+        assert rule.check(operation, mock_migration) is None
+
+    def test_detects_foreign_key_with_db_constraint(self, mock_migration):
+        """Test that a NOT NULL ForeignKey with a constraint is flagged."""
+        rule = NotNullWithoutDefaultRule()
+        operation = migrations.AddField(
+            model_name="article",
+            name="author",
+            field=models.ForeignKey(to="auth.User", on_delete=models.CASCADE),
+        )
+
+        issue = rule.check(operation, mock_migration)
+
+        assert issue is not None
+        assert issue.rule_id == "SM001"
+
+
+class TestNotNullWithoutDefaultRuleHasDefault:
+    """Tests for SM001 honouring custom has_default() implementations."""
+
+    def test_allows_field_overriding_has_default(self, mock_migration):
+        """Test that a field whose has_default() returns True is allowed."""
+
+        class AlwaysDefaultField(models.IntegerField):
+            def has_default(self):
+                return True
+
+        rule = NotNullWithoutDefaultRule()
+        operation = migrations.AddField(
+            model_name="user", name="count", field=AlwaysDefaultField()
+        )
+
+        assert rule.check(operation, mock_migration) is None
+
+    def test_stock_has_default_is_not_called(self, mock_migration):
+        """Test that Django's own has_default() is not called redundantly."""
+        from unittest.mock import patch
+
+        rule = NotNullWithoutDefaultRule()
+        operation = migrations.AddField(
+            model_name="user", name="count", field=models.IntegerField()
+        )
+
+        with patch.object(
+            models.Field, "has_default", side_effect=AssertionError
+        ) as spy:
+            issue = rule.check(operation, mock_migration)
+
+        assert issue is not None
+        spy.assert_not_called()
+
 
 class TestExpensiveDefaultCallableRule:
     """Tests for ExpensiveDefaultCallableRule (SM022)."""
@@ -268,6 +332,26 @@ class TestExpensiveDefaultCallableRule:
         assert issue is not None
         assert issue.rule_id == "SM022"
 
+    def test_qualified_fast_name_overrides_slow_short_name(self, mock_migration):
+        """A fully-qualified FAST_CALLABLES entry wins over a slow short name."""
+        from django.utils import timezone
+
+        from django_safe_migrations.rules.add_field import ExpensiveDefaultCallableRule
+
+        class TrustedNowRule(ExpensiveDefaultCallableRule):
+            FAST_CALLABLES = ExpensiveDefaultCallableRule.FAST_CALLABLES | {
+                "django.utils.timezone.now"
+            }
+
+        operation = migrations.AddField(
+            model_name="article",
+            name="created_at",
+            field=models.DateTimeField(default=timezone.now),
+        )
+
+        assert TrustedNowRule().check(operation, mock_migration) is None
+        assert ExpensiveDefaultCallableRule().check(operation, mock_migration)
+
     def test_flags_date_today_callable(self, mock_migration):
         """SM022 flags datetime.date.today (its bare __name__ is 'today')."""
         import datetime
@@ -407,6 +491,24 @@ class TestPreferBigIntRule:
         assert issue.rule_id == "SM028"
         assert "SmallAutoField" in issue.message
 
+    def test_detects_same_named_autofield_subclass(self, mock_migration):
+        """Test that rule matches a project AutoField subclass by name."""
+        from django_safe_migrations.rules.add_field import PreferBigIntRule
+
+        class AutoField(models.AutoField):
+            pass
+
+        rule = PreferBigIntRule()
+        operation = migrations.AddField(
+            model_name="user",
+            name="id",
+            field=AutoField(primary_key=True),
+        )
+        issue = rule.check(operation, mock_migration)
+
+        assert issue is not None
+        assert issue.rule_id == "SM028"
+
     def test_allows_bigautofield_pk(self, mock_migration):
         """Test that rule allows BigAutoField primary key."""
         from django_safe_migrations.rules.add_field import PreferBigIntRule
@@ -470,6 +572,40 @@ class TestPreferBigIntRule:
 
         assert issue is None
 
+    def test_detects_pk_declared_after_other_fields(self, mock_migration):
+        """Test that rule finds a small pk that is not the first field."""
+        from django_safe_migrations.rules.add_field import PreferBigIntRule
+
+        rule = PreferBigIntRule()
+        operation = migrations.CreateModel(
+            name="Article",
+            fields=[
+                ("title", models.CharField(max_length=200)),
+                ("code", models.SmallAutoField(primary_key=True)),
+            ],
+        )
+        issue = rule.check(operation, mock_migration)
+
+        assert issue is not None
+        assert "'code'" in issue.message
+        assert "SmallAutoField" in issue.message
+
+    def test_ignores_create_model_without_explicit_pk(self, mock_migration):
+        """Test that rule ignores CreateModel with no primary_key field."""
+        from django_safe_migrations.rules.add_field import PreferBigIntRule
+
+        rule = PreferBigIntRule()
+        operation = migrations.CreateModel(
+            name="Article",
+            fields=[
+                ("title", models.CharField(max_length=200)),
+                ("counter", models.IntegerField()),
+            ],
+        )
+        issue = rule.check(operation, mock_migration)
+
+        assert issue is None
+
     def test_ignores_non_addfield_non_createmodel(self, mock_migration):
         """Test that rule ignores RemoveField and other operations."""
         from django_safe_migrations.rules.add_field import PreferBigIntRule
@@ -385,6 +385,39 @@ class TestAddForeignKeyValidatesRule:
         assert issue.severity == Severity.WARNING
         assert "author" in issue.message
 
+    def test_detects_one_to_one_field(self, mock_migration):
+        """Test that rule detects OneToOneField with db_constraint=True."""
+        rule = AddForeignKeyValidatesRule()
+        operation = migrations.AddField(
+            model_name="profile",
+            name="user",
+            field=models.OneToOneField(
+                to="auth.User",
+                on_delete=models.CASCADE,
+            ),
+        )
+        issue = rule.check(operation, mock_migration)
+
+        assert issue is not None
+        assert issue.rule_id == "SM005"
+
+    def test_detects_same_named_foreign_key_subclass(self, mock_migration):
+        """Test that rule matches a project ForeignKey subclass by name."""
+
+        class ForeignKey(models.ForeignKey):
+            pass
+
+        rule = AddForeignKeyValidatesRule()
+        operation = migrations.AddField(
+            model_name="article",
+            name="author",
+            field=ForeignKey(to="auth.User", on_delete=models.CASCADE),
+        )
+        issue = rule.check(operation, mock_migration)
+
+        assert issue is not None
+        assert issue.rule_id == "SM005"
+
     def test_allows_foreign_key_without_constraint(self, mock_migration):
         """Test that rule allows ForeignKey with db_constraint=False."""
         rule = AddForeignKeyValidatesRule()
@@ -490,6 +523,25 @@ class TestAlterVarcharLengthRule:
         assert issue.severity == Severity.WARNING
         assert "username" in issue.message
 
+    def test_detects_same_named_charfield_subclass(self, mock_migration):
+        """Test that rule matches a project CharField subclass by name."""
+
+        class CharField(models.CharField):
+            pass
+
+        rule = AlterVarcharLengthRule()
+        operation = migrations.AlterField(
+            model_name="user",
+            name="username",
+            field=CharField(max_length=50),
+        )
+        issue = rule.check(
+            operation, mock_migration, old_field=CharField(max_length=100)
+        )
+
+        assert issue is not None
+        assert issue.rule_id == "SM013"
+
     def test_ignores_non_charfield(self, mock_migration):
         """Test that rule ignores non-CharField types."""
         rule = AlterVarcharLengthRule()
@@ -8,9 +8,11 @@ from django_safe_migrations.rules import (
     ALL_RULES,
     _load_extra_rules,
     clear_extra_rules_cache,
+    format_rules_listing,
     get_all_rule_ids,
     get_all_rules,
     get_rule_by_id,
+    get_rules_info,
 )
 from django_safe_migrations.rules.base import BaseRule, Severity
 
@@ -151,6 +153,39 @@ class TestGetAllRulesWithExtras:
             rule_ids = {r.rule_id for r in rules}
             assert "CUSTOM001" in rule_ids
 
+    def test_reuses_rule_instances_per_vendor(self):
+        """Test that rules are instantiated once per vendor, in fresh lists."""
+        with patch("django_safe_migrations.conf.get_extra_rules") as mock_get:
+            mock_get.return_value = []
+
+            first = get_all_rules("postgresql")
+            first.clear()
+            second = get_all_rules("postgresql")
+            third = get_all_rules("postgresql")
+
+            assert second
+            assert second is not third
+            assert all(a is b for a, b in zip(second, third))
+            assert {type(r) for r in get_all_rules("sqlite")} != {
+                type(r) for r in second
+            }
+
+    def test_clear_cache_reinstantiates_rules(self):
+        """Test that clearing the cache picks up new EXTRA_RULES."""
+        rule_path = "tests.unit.rules.test_extra_rules.MockCustomRule"
+
+        with patch("django_safe_migrations.conf.get_extra_rules") as mock_get:
+            mock_get.return_value = []
+            before = get_all_rules("postgresql")
+
+            mock_get.return_value = [rule_path]
+            clear_extra_rules_cache()
+            after = get_all_rules("postgresql")
+
+            assert "CUSTOM001" not in {r.rule_id for r in before}
+            assert "CUSTOM001" in {r.rule_id for r in after}
+            assert before[0] is not after[0]
+
 
 class TestGetAllRuleIdsWithExtras:
     """Tests for get_all_rule_ids with EXTRA_RULES."""
@@ -176,6 +211,59 @@ class TestGetAllRuleIdsWithExtras:
             assert "SM001" in rule_ids  # Builtin still there
 
 
+class TestGetRulesInfo:
+    """Tests for get_rules_info and format_rules_listing."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        clear_extra_rules_cache()
+
+    def teardown_method(self):
+        """Clear cache after each test."""
+        clear_extra_rules_cache()
+
+    def test_lists_builtin_then_custom_rules(self):
+        """Test built-in rules come first, followed by EXTRA_RULES."""
+        rule_path = "tests.unit.rules.test_extra_rules.MockCustomRule"
+
+        with patch("django_safe_migrations.conf.get_extra_rules") as mock_get:
+            mock_get.return_value = [rule_path]
+
+            info = get_rules_info()
+
+        assert len(info) == len(ALL_RULES) + 1
+        assert info[-1] == {
+            "rule_id": "CUSTOM001",
+            "severity": "warning",
+            "description": "A custom test rule",
+            "categories": [],
+            "db_vendors": ["all"],
+        }
+
+    def test_format_rules_listing(self):
+        """Test the console listing renders one block per rule."""
+        lines = format_rules_listing(
+            [
+                {
+                    "rule_id": "SM999",
+                    "severity": "error",
+                    "description": "Example",
+                    "categories": [],
+                    "db_vendors": ["postgresql"],
+                }
+            ]
+        )
+
+        assert lines == [
+            "Available Rules:",
+            "-" * 80,
+            "SM999 [ERROR] Example",
+            "    Categories: none",
+            "    Databases: postgresql",
+            "",
+        ]
+
+
 class TestGetRuleByIdWithExtras:
     """Tests for get_rule_by_id with EXTRA_RULES."""
 
@@ -178,6 +178,17 @@ class TestMigrationAnalyzer:
         # Will return True unless settings have DISABLED_RULES or DISABLED_CATEGORIES
         assert isinstance(analyzer_default._is_rule_enabled("SM001"), bool)
 
+    def test_explicit_disabled_rules_ignore_settings(self):
+        """An explicit disabled_rules iterable replaces settings-based checks."""
+        with override_settings(SAFE_MIGRATIONS={"DISABLED_RULES": ["SM001"]}):
+            analyzer = MigrationAnalyzer(
+                db_vendor="postgresql",
+                disabled_rules=(rule_id for rule_id in ["SM006"]),
+            )
+
+            assert analyzer._is_rule_enabled("SM001") is True
+            assert analyzer._is_rule_enabled("SM006") is False
+
 
 class TestErrorRecovery:
     """Tests for error recovery with malformed migrations."""
@@ -397,6 +408,24 @@ class TestAnalyzeAll:
                 "contenttypes",
             )
 
+    def test_analyze_all_accepts_any_iterable(self):
+        """exclude_apps may be a frozenset or generator, not just a list."""
+        analyzer = MigrationAnalyzer(db_vendor="postgresql")
+
+        from_set = analyzer.analyze_all(exclude_apps=frozenset({"testapp"}))
+        from_gen = analyzer.analyze_all(exclude_apps=(a for a in ["testapp"]))
+
+        assert not any(i.app_label == "testapp" for i in from_set)
+        assert not any(i.app_label == "testapp" for i in from_gen)
+
+    def test_analyze_all_matches_analyze_app(self):
+        """Grouped analysis yields the same testapp issues as analyze_app."""
+        analyzer = MigrationAnalyzer(db_vendor="postgresql")
+        all_issues = analyzer.analyze_all(exclude_apps=[])
+        from_all = [i.to_dict() for i in all_issues if i.app_label == "testapp"]
+        from_app = [i.to_dict() for i in analyzer.analyze_app("testapp")]
+        assert from_all == from_app
+
 
 class TestAnalyzeNewMigrations:
     """Tests for MigrationAnalyzer.analyze_new_migrations."""
@@ -766,3 +795,256 @@ class TestSeverityOverrides:
         sm001_issues = [i for i in issues if i.rule_id == "SM001"]
         assert len(sm001_issues) == 1
         assert sm001_issues[0].severity == Severity.WARNING
+
+
+class TestActiveRuleCache:
+    """Tests for the analyzer's precomputed active-rule cache."""
+
+    def test_active_rules_exclude_other_vendors(self):
+        """Rules for another database vendor are filtered out up front."""
+        analyzer = MigrationAnalyzer(db_vendor="sqlite")
+
+        active_ids = {rule.rule_id for rule in analyzer._get_active_rules(None)}
+
+        assert "SM001" in active_ids
+        assert "SM010" not in active_ids  # PostgreSQL-only
+
+    def test_invalidate_rule_cache_picks_up_new_rules(self, mock_migration_factory):
+        """Mutating analyzer.rules takes effect after invalidate_rule_cache()."""
+        from django_safe_migrations.rules.add_field import NotNullWithoutDefaultRule
+        from django_safe_migrations.rules.remove_field import DropColumnUnsafeRule
+
+        operation = migrations.AddField(
+            model_name="user",
+            name="email",
+            field=models.CharField(max_length=255),
+        )
+        migration = mock_migration_factory([operation])
+        analyzer = MigrationAnalyzer(
+            rules=[DropColumnUnsafeRule()], db_vendor="postgresql"
+        )
+        assert analyzer.analyze_migration(migration) == []
+
+        analyzer.rules = [NotNullWithoutDefaultRule()]
+        analyzer.invalidate_rule_cache()
+        issues = analyzer.analyze_migration(migration)
+
+        assert [issue.rule_id for issue in issues] == ["SM001"]
+
+    def test_app_rules_resolved_in_one_lookup(self):
+        """Active rules and severities for an app come from one batched call."""
+        from unittest.mock import patch
+
+        from django_safe_migrations.conf import get_effective_rules_for_app
+        from django_safe_migrations.rules.base import Severity
+
+        app_rules = {
+            "legacy": {
+                "DISABLED_RULES": ["SM001"],
+                "RULE_SEVERITY": {"SM002": "info"},
+            }
+        }
+        with override_settings(SAFE_MIGRATIONS={"APP_RULES": app_rules}):
+            analyzer = MigrationAnalyzer(db_vendor="postgresql")
+            with patch(
+                "django_safe_migrations.analyzer.get_effective_rules_for_app",
+                wraps=get_effective_rules_for_app,
+            ) as spy:
+                active_ids = {r.rule_id for r in analyzer._get_active_rules("legacy")}
+                overrides = analyzer._get_severity_overrides("legacy")
+
+        assert spy.call_count == 1
+        assert "SM001" not in active_ids
+        assert "SM002" in active_ids
+        assert overrides["SM002"] == Severity.INFO
+
+
+class TestParallelAnalyzeAll:
+    """Tests for analyze_all with jobs > 1."""
+
+    def test_parallel_matches_serial(self):
+        """Parallel analysis returns the same issues, in the same order."""
+        from unittest.mock import patch
+
+        serial = MigrationAnalyzer(db_vendor="postgresql").analyze_all(exclude_apps=[])
+        with patch("django_safe_migrations.analyzer._MIN_PARALLEL_APPS", 1):
+            parallel = MigrationAnalyzer(db_vendor="postgresql", jobs=2).analyze_all(
+                exclude_apps=[]
+            )
+
+        assert [i.to_dict() for i in parallel] == [i.to_dict() for i in serial]
+
+    def test_falls_back_to_serial_when_pool_fails(self):
+        """A pool start-up failure falls back to serial analysis."""
+        from unittest.mock import patch
+
+        analyzer = MigrationAnalyzer(db_vendor="postgresql", jobs=2)
+        with (
+            patch("django_safe_migrations.analyzer._MIN_PARALLEL_APPS", 1),
+            patch(
+                "concurrent.futures.ProcessPoolExecutor",
+                side_effect=OSError("no processes"),
+            ),
+        ):
+            issues = analyzer.analyze_all(exclude_apps=[])
+
+        assert any(i.app_label == "testapp" for i in issues)
+
+    def test_jobs_zero_uses_cpu_count(self):
+        """jobs=0 resolves to one worker per CPU."""
+        from unittest.mock import patch
+
+        with patch("django_safe_migrations.analyzer.os.cpu_count", return_value=3):
+            analyzer = MigrationAnalyzer(db_vendor="postgresql", jobs=0)
+        assert analyzer.jobs == 3
+
+
+class TestOperationTypeIndex:
+    """Tests for dispatching operations only to rules that declare them."""
+
+    def test_rule_not_called_for_other_operation_types(self, mock_migration_factory):
+        """check() is skipped for operations outside operation_types."""
+        from unittest.mock import patch
+
+        from django_safe_migrations.rules.remove_field import DropColumnUnsafeRule
+
+        operation = migrations.AddField(
+            model_name="user",
+            name="email",
+            field=models.CharField(max_length=255, null=True),
+        )
+        migration = mock_migration_factory([operation])
+        analyzer = MigrationAnalyzer(
+            rules=[DropColumnUnsafeRule()], db_vendor="postgresql"
+        )
+
+        with patch.object(DropColumnUnsafeRule, "check") as mock_check:
+            analyzer.analyze_migration(migration)
+
+        mock_check.assert_not_called()
+
+    def test_operation_subclasses_are_dispatched(self, mock_migration_factory):
+        """Subclasses of a declared operation type still reach the rule."""
+
+        class CustomAddField(migrations.AddField):
+            pass
+
+        operation = CustomAddField(
+            model_name="user",
+            name="email",
+            field=models.CharField(max_length=255),
+        )
+        migration = mock_migration_factory([operation])
+        analyzer = MigrationAnalyzer(db_vendor="postgresql")
+
+        issues = analyzer.analyze_migration(migration)
+
+        assert any(issue.rule_id == "SM001" for issue in issues)
+
+    def test_rules_without_operation_types_see_everything(self):
+        """Rules leaving operation_types as None are called for every op."""
+        from django_safe_migrations.rules.base import BaseRule, Severity
+
+        class AnyOperationRule(BaseRule):
+            rule_id = "CUSTOM001"
+            severity = Severity.INFO
+            description = "Sees every operation"
+
+            def check(self, operation, migration, **kwargs):
+                return None
+
+        assert AnyOperationRule.operation_types is None
+        analyzer = MigrationAnalyzer(rules=[AnyOperationRule()], db_vendor="postgresql")
+
+        rules = analyzer._get_rules_for_operation(None, migrations.DeleteModel)
+
+        assert [rule.rule_id for rule in rules] == ["CUSTOM001"]
+
+    def test_concurrent_rule_only_sees_index_operations(self):
+        """SM018 is dispatched index operations and their concurrent subclasses."""
+        from django_safe_migrations.rules.add_index import (
+            ConcurrentInAtomicMigrationRule,
+        )
+
+        class AddIndexConcurrently(migrations.AddIndex):
+            pass
+
+        analyzer = MigrationAnalyzer(
+            rules=[ConcurrentInAtomicMigrationRule()], db_vendor="postgresql"
+        )
+
+        assert analyzer._get_rules_for_operation(None, migrations.AddField) == ()
+        assert [
+            rule.rule_id
+            for rule in analyzer._get_rules_for_operation(None, AddIndexConcurrently)
+        ] == ["SM018"]
+
+
+class TestLoaderReuse:
+    """Tests for the analyzer's shared MigrationLoader."""
+
+    def test_loader_built_once_across_calls(self):
+        """Repeated analyze_app calls share one MigrationLoader."""
+        from unittest.mock import patch
+
+        from django.db.migrations.loader import MigrationLoader
+
+        with patch(
+            "django.db.migrations.loader.MigrationLoader", wraps=MigrationLoader
+        ) as mock_loader_cls:
+            analyzer = MigrationAnalyzer(db_vendor="postgresql")
+            analyzer.analyze_app("testapp")
+            analyzer.analyze_app("testapp")
+            analyzer.analyze_all(exclude_apps=[])
+
+        assert mock_loader_cls.call_count == 1
+
+    def test_invalidate_loaders_rebuilds(self):
+        """invalidate_loaders() forces a fresh loader on next use."""
+        analyzer = MigrationAnalyzer(db_vendor="postgresql")
+        first = analyzer.get_loader()
+        assert analyzer.get_loader() is first
+
+        analyzer.invalidate_loaders()
+
+        assert analyzer.get_loader() is not first
+
+    def test_context_manager_closes(self):
+        """Leaving a with block drops cached loaders."""
+        with MigrationAnalyzer(db_vendor="postgresql") as analyzer:
+            analyzer.analyze_app("testapp")
+            assert analyzer._loaders
+
+        assert not analyzer._loaders
+
+
+class TestShouldFail:
+    """Tests for MigrationAnalyzer.should_fail."""
+
+    @staticmethod
+    def _issue(severity, rule_id="SM001"):
+        from django_safe_migrations.rules.base import Issue
+
+        return Issue(rule_id=rule_id, severity=severity, operation="op", message="msg")
+
+    def test_errors_fail(self):
+        """Any error fails the run."""
+        from django_safe_migrations.rules.base import Severity
+
+        assert MigrationAnalyzer.should_fail([self._issue(Severity.ERROR)])
+
+    def test_warnings_pass_by_default(self):
+        """Warnings and info alone do not fail the run."""
+        from django_safe_migrations.rules.base import Severity
+
+        issues = [self._issue(Severity.WARNING), self._issue(Severity.INFO)]
+        assert not MigrationAnalyzer.should_fail(issues)
+        assert MigrationAnalyzer.should_fail(issues, fail_on_warning=True)
+
+    def test_promoted_warnings_fail(self):
+        """Warnings from rules in warnings_as_errors fail the run."""
+        from django_safe_migrations.rules.base import Severity
+
+        issues = [self._issue(Severity.WARNING, "SM002")]
+        assert not MigrationAnalyzer.should_fail(issues, warnings_as_errors={"SM003"})
+        assert MigrationAnalyzer.should_fail(issues, warnings_as_errors={"SM002"})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -68,6 +69,30 @@ class TestGenerateBaseline:
         assert "count" in data
         assert "issues" in data
 
+    def test_stdlib_and_orjson_output_match(self, tmp_path, sample_issues):
+        """Test that the orjson fast path writes the same bytes as the stdlib."""
+        pytest.importorskip("orjson")
+        issues = sample_issues + [
+            Issue(
+                rule_id="SM002",
+                severity=Severity.WARNING,
+                operation="RemoveField(café.näme_ß)",
+                message="Dropping column",
+                app_label="myapp",
+                migration_name="0004_remove_näme",
+            )
+        ]
+        stdlib_path = tmp_path / "stdlib.json"
+        fast_path = tmp_path / "fast.json"
+
+        with patch("django_safe_migrations.baseline._HAS_ORJSON", False):
+            generate_baseline(issues, str(stdlib_path))
+        generate_baseline(issues, str(fast_path))
+
+        assert "café.näme_ß".encode() in stdlib_path.read_bytes()
+
+        assert fast_path.read_bytes() == stdlib_path.read_bytes()
+
     def test_baseline_version_is_two(self, tmp_path, sample_issues):
         """Test that the baseline format version is 2 (adds operation_index)."""
         baseline_path = str(tmp_path / "baseline.json")
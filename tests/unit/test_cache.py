@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import json
+import pickle
+import sys
+
+import pytest
 
 from django_safe_migrations.analyzer import MigrationAnalyzer
 from django_safe_migrations.cache import (
@@ -96,6 +100,28 @@ class TestIssueRoundTrip:
         issue = _issue(suggestion=None, line_number=None, operation_index=None)
         assert Issue.from_dict(issue.to_dict()) == issue
 
+    def test_unknown_severity_raises(self):
+        """An unrecognised severity value is rejected rather than guessed."""
+        data = _issue().to_dict()
+        data["severity"] = "critical"
+        with pytest.raises(ValueError):
+            Issue.from_dict(data)
+
+    def test_pickle_round_trip(self):
+        """Issues survive pickling, as used by parallel analysis workers."""
+        issue = _issue()
+        assert pickle.loads(pickle.dumps(issue)) == issue
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+"
+    )
+    def test_issue_uses_slots(self):
+        """Issue instances carry no per-instance __dict__."""
+        issue = _issue()
+        assert not hasattr(issue, "__dict__")
+        with pytest.raises(AttributeError):
+            issue.not_a_field = 1
+
 
 class TestAnalysisCache:
     """Tests for the AnalysisCache store."""
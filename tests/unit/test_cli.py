@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import os
 
+import pytest
+
 from django_safe_migrations import cli
 
 
@@ -15,6 +17,12 @@ def _raise(*args, **kwargs):
 class TestSetupDjango:
     """Tests for setup_django() error handling."""
 
+    @pytest.fixture(autouse=True)
+    def _isolate(self, monkeypatch, tmp_path):
+        """Start each test with Django not ready and an empty hint cache."""
+        monkeypatch.setattr(cli, "_DJANGO_READY", False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
     def test_surfaces_real_error_when_module_set(self, monkeypatch, capsys):
         """An explicit DJANGO_SETTINGS_MODULE that fails reports the real error.
 
@@ -47,6 +55,92 @@ class TestSetupDjango:
         assert cli.setup_django() is False
         assert "DJANGO_SETTINGS_MODULE" not in os.environ
 
+    def test_remembers_working_candidate(self, monkeypatch):
+        """The settings module that worked is tried first on the next run."""
+        monkeypatch.delenv("DJANGO_SETTINGS_MODULE", raising=False)
+        import django
+
+        tried = []
+
+        def fake_setup():
+            module = os.environ["DJANGO_SETTINGS_MODULE"]
+            tried.append(module)
+            if module != "config.settings":
+                _raise()
+
+        monkeypatch.setattr(django, "setup", fake_setup)
+
+        assert cli.setup_django() is True
+        assert tried == ["settings", "config.settings"]
+
+        tried.clear()
+        monkeypatch.setattr(cli, "_DJANGO_READY", False)
+        monkeypatch.delenv("DJANGO_SETTINGS_MODULE")
+
+        assert cli.setup_django() is True
+        assert tried == ["config.settings"]
+
+    def test_hint_disabled_by_env(self, monkeypatch):
+        """The opt-out env var skips reading and writing the hint file."""
+        monkeypatch.delenv("DJANGO_SETTINGS_MODULE", raising=False)
+        monkeypatch.setenv("DJANGO_SAFE_MIGRATIONS_NO_SETTINGS_HINT", "1")
+        import django
+
+        tried = []
+
+        def fake_setup():
+            tried.append(os.environ["DJANGO_SETTINGS_MODULE"])
+
+        monkeypatch.setattr(django, "setup", fake_setup)
+        cli._settings_hint_path().parent.mkdir(parents=True)
+        cli._settings_hint_path().write_text(
+            json.dumps({os.getcwd(): "config.settings"}), encoding="utf-8"
+        )
+
+        assert cli.setup_django() is True
+        assert tried == ["settings"]  # documented order, hint ignored
+        hints = json.loads(cli._settings_hint_path().read_text(encoding="utf-8"))
+        assert hints == {os.getcwd(): "config.settings"}  # not rewritten
+
+    def test_hint_file_keeps_most_recent_directories(self, monkeypatch):
+        """Old directories are dropped once the hint file is full."""
+        monkeypatch.setattr(cli, "_MAX_SETTINGS_HINTS", 2)
+        monkeypatch.chdir(cli._settings_hint_path().parents[1])
+        cli._settings_hint_path().parent.mkdir(parents=True)
+        cli._settings_hint_path().write_text(
+            json.dumps({"/old": "settings", "/newer": "settings"}),
+            encoding="utf-8",
+        )
+
+        cli._write_settings_hint("config.settings")
+
+        hints = json.loads(cli._settings_hint_path().read_text(encoding="utf-8"))
+        assert list(hints) == ["/newer", os.getcwd()]
+
+    def test_clear_settings_hint(self, capsys):
+        """--clear-settings-hint deletes the hint file without Django setup."""
+        cli._write_settings_hint("settings")
+        assert cli._settings_hint_path().exists()
+
+        assert cli.main(["--clear-settings-hint"]) == 0
+        assert not cli._settings_hint_path().exists()
+        assert "Removed" in capsys.readouterr().out
+
+        assert cli.main(["--clear-settings-hint"]) == 0
+        assert "No remembered settings module" in capsys.readouterr().out
+
+    def test_skips_setup_once_ready(self, monkeypatch):
+        """Once Django is set up, later calls don't run django.setup() again."""
+        monkeypatch.setenv("DJANGO_SETTINGS_MODULE", "tests.test_project.settings")
+        import django
+
+        calls = []
+        monkeypatch.setattr(django, "setup", lambda: calls.append(1))
+
+        assert cli.setup_django() is True
+        assert cli.setup_django() is True
+        assert calls == [1]
+
 
 class TestMain:
     """Tests for the main() entry point."""
@@ -131,3 +225,70 @@ class TestMain:
         assert called["commit"] == "abc123"
         # No changed migrations -> empty issue set.
         assert json.loads(out)["total"] == 0
+
+
+class TestDiffMode:
+    """Tests for --diff / --since-commit batching."""
+
+    def test_each_changed_app_analyzed_once(self, monkeypatch, capsys):
+        """Several changed migrations in one app trigger a single analyze_app."""
+        monkeypatch.setattr(cli, "setup_django", lambda: True)
+
+        from django_safe_migrations import diff as diff_mod
+        from django_safe_migrations.analyzer import MigrationAnalyzer
+        from django_safe_migrations.rules.base import Issue, Severity
+
+        monkeypatch.setattr(
+            diff_mod,
+            "get_committed_apps_and_migrations",
+            lambda commit: [
+                ("testapp", "0002_unsafe"),
+                ("testapp", "0003_more"),
+                ("admin", "0001_initial"),
+            ],
+        )
+
+        calls = []
+
+        def fake_analyze_app(self, app_label, loader=None):
+            calls.append(app_label)
+            return [
+                Issue(
+                    rule_id="SM001",
+                    severity=Severity.ERROR,
+                    operation="AddField",
+                    message="m",
+                    app_label=app_label,
+                    migration_name=name,
+                )
+                for name in ("0001_initial", "0002_unsafe", "0003_more")
+            ]
+
+        monkeypatch.setattr(MigrationAnalyzer, "analyze_app", fake_analyze_app)
+
+        cli.main(["--since-commit", "abc123", "--format=json"])
+        out = json.loads(capsys.readouterr().out)
+
+        assert calls == ["testapp"]
+        assert out["total"] == 2
+
+
+class TestLazyExports:
+    """Tests for the package's lazily imported public names."""
+
+    def test_public_names_resolve(self):
+        """MigrationAnalyzer, Issue and Severity are importable from the root."""
+        import django_safe_migrations
+        from django_safe_migrations.analyzer import MigrationAnalyzer
+        from django_safe_migrations.rules.base import Issue, Severity
+
+        assert django_safe_migrations.MigrationAnalyzer is MigrationAnalyzer
+        assert django_safe_migrations.Issue is Issue
+        assert django_safe_migrations.Severity is Severity
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Unknown attributes still raise AttributeError."""
+        import django_safe_migrations
+
+        with pytest.raises(AttributeError):
+            django_safe_migrations.does_not_exist  # noqa: B018
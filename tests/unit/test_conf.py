@@ -24,6 +24,7 @@ from django_safe_migrations.conf import (
     get_rules_from_categories,
     get_rules_in_category,
     get_severity_overrides,
+    get_severity_overrides_for_app,
     is_rule_disabled,
     is_rule_disabled_by_category,
     is_rule_enabled,
@@ -153,6 +154,21 @@ class TestGetSeverityOverrides:
 
             assert result["SM001"] == Severity.ERROR
 
+    def test_handles_mixed_case_and_drops_unknown_severity(self):
+        """Test mixed-case names resolve and unknown names are dropped."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "RULE_SEVERITY": {
+                    "SM001": "Warning",
+                    "SM002": "critical",
+                    "SM003": 3,
+                },
+            }
+
+            result = get_severity_overrides()
+
+            assert result == {"SM001": Severity.WARNING}
+
     def test_preserves_severity_enum_values(self):
         """Test preserves Severity enum values passed directly."""
         with patch("django_safe_migrations.conf.settings") as mock_settings:
@@ -218,6 +234,13 @@ class TestGetExcludedApps:
 
             assert result == ["myapp", "otherapp"]
 
+    def test_default_matches_builtin_apps(self):
+        """Test the default list is the sorted DJANGO_BUILTIN_APPS set."""
+        from django_safe_migrations.conf import DEFAULTS, DJANGO_BUILTIN_APPS
+
+        assert isinstance(DJANGO_BUILTIN_APPS, frozenset)
+        assert DEFAULTS["EXCLUDED_APPS"] == sorted(DJANGO_BUILTIN_APPS)
+
 
 class TestGetFailOnWarning:
     """Tests for get_fail_on_warning function."""
@@ -393,6 +416,33 @@ class TestGetRulesFromCategories:
         assert "SM002" in result
         assert "SM003" in result
 
+    def test_accepts_any_iterable(self):
+        """Test order and duplicates do not matter, and generators work."""
+        expected = get_rules_from_categories(["indexes", "destructive"])
+
+        assert get_rules_from_categories(("destructive", "indexes")) == expected
+        assert (
+            get_rules_from_categories(c for c in ["indexes", "destructive", "indexes"])
+            == expected
+        )
+
+    def test_equivalent_groups_share_cache_entry(self):
+        """Test reordered or repeated categories hit the same cache entry."""
+        from django_safe_migrations.conf import _rules_from_categories
+
+        _rules_from_categories.cache_clear()
+        get_rules_from_categories(["indexes", "destructive"])
+        get_rules_from_categories(["destructive", "indexes", "destructive"])
+
+        info = _rules_from_categories.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_result_is_a_fresh_set(self):
+        """Test mutating the returned set does not affect later calls."""
+        get_rules_from_categories(["indexes"]).add("SM999")
+
+        assert "SM999" not in get_rules_from_categories(["indexes"])
+
     def test_deduplicates_rules(self):
         """Test that rules appearing in multiple categories are deduplicated."""
         # Get rules from overlapping categories
@@ -538,6 +588,18 @@ class TestGetCategoryForRule:
         assert "destructive" in result
         assert "data-loss" in result
 
+    def test_matches_category_declaration_order(self):
+        """Test the reverse index agrees with a scan of RULE_CATEGORIES."""
+        rule_ids = {rule_id for rules in RULE_CATEGORIES.values() for rule_id in rules}
+
+        for rule_id in rule_ids:
+            expected = [
+                category
+                for category, rules in RULE_CATEGORIES.items()
+                if rule_id in rules
+            ]
+            assert get_category_for_rule(rule_id) == expected
+
 
 # -----------------------------------------------------------------------------
 # Per-App Configuration Tests
@@ -766,6 +828,49 @@ class TestGetRuleSeverityForApp:
 # -----------------------------------------------------------------------------
 
 
+class TestGetSeverityOverridesForApp:
+    """Tests for get_severity_overrides_for_app function."""
+
+    def test_merges_app_over_global(self):
+        """Test app-specific overrides win and global ones are kept."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "RULE_SEVERITY": {"SM001": "WARNING", "SM002": "error"},
+                "APP_RULES": {
+                    "legacy_app": {"RULE_SEVERITY": {"SM001": "INFO"}},
+                },
+            }
+
+            result = get_severity_overrides_for_app("legacy_app")
+
+            assert result == {"SM001": Severity.INFO, "SM002": Severity.ERROR}
+
+    def test_global_only_without_app(self):
+        """Test only global overrides apply when app_label is None."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "RULE_SEVERITY": {"SM001": "WARNING"},
+                "APP_RULES": {
+                    "legacy_app": {"RULE_SEVERITY": {"SM001": "INFO"}},
+                },
+            }
+
+            result = get_severity_overrides_for_app(None)
+
+            assert result == {"SM001": Severity.WARNING}
+
+    def test_ignores_invalid_values(self):
+        """Test unrecognised severity values are dropped."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "APP_RULES": {
+                    "myapp": {"RULE_SEVERITY": {"SM001": "LOUD", "SM002": 3}},
+                },
+            }
+
+            assert get_severity_overrides_for_app("myapp") == {}
+
+
 class TestStringSimilarity:
     """Tests for string similarity functions."""
 
@@ -1379,3 +1484,220 @@ class TestV070Config:
             assert get_warnings_as_errors() == ["SM002"]
         with override_settings(SAFE_MIGRATIONS={}):
             assert get_warnings_as_errors() == []
+
+
+class TestConfigCache:
+    """Tests for memoized settings lookups."""
+
+    def test_override_settings_invalidates_cache(self):
+        """Test overriding SAFE_MIGRATIONS is seen by cached helpers."""
+        from django.test import override_settings
+
+        with override_settings(SAFE_MIGRATIONS={"DISABLED_RULES": ["SM001"]}):
+            assert is_rule_disabled("SM001") is True
+            with override_settings(SAFE_MIGRATIONS={"EXCLUDED_APPS": ["x"]}):
+                assert is_rule_disabled("SM001") is False
+                assert get_excluded_apps() == ["x"]
+            assert is_rule_disabled("SM001") is True
+
+    def test_replaced_settings_object_invalidates_cache(self):
+        """Test patching in a new settings object is seen by cached helpers."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"RULE_SEVERITY": {"SM001": "info"}}
+            assert get_rule_severity("SM001", Severity.ERROR) == Severity.INFO
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {}
+            assert get_rule_severity("SM001", Severity.ERROR) == Severity.ERROR
+
+    def test_reuses_resolved_config(self):
+        """Test repeated lookups do not rebuild the merged config."""
+        from django_safe_migrations import conf
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"DISABLED_RULES": ["SM002"]}
+            is_rule_disabled("SM001")
+
+            with patch.object(conf, "_config", wraps=conf._config) as spy:
+                for _ in range(5):
+                    is_rule_disabled("SM002")
+                    get_excluded_apps()
+                    get_rule_severity("SM001", Severity.ERROR)
+
+            assert spy.call_count == 2  # EXCLUDED_APPS and RULE_SEVERITY once
+
+    def test_clear_config_cache_picks_up_in_place_edits(self):
+        """Test clear_config_cache re-reads a mutated SAFE_MIGRATIONS dict."""
+        from django_safe_migrations.conf import clear_config_cache
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"DISABLED_RULES": []}
+            assert is_rule_disabled("SM001") is False
+
+            mock_settings.SAFE_MIGRATIONS["DISABLED_RULES"] = ["SM001"]
+            clear_config_cache()
+
+            assert is_rule_disabled("SM001") is True
+
+    def test_get_config_returns_independent_copies(self):
+        """Test get_config results can be mutated without affecting the cache."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"FAIL_ON_WARNING": True}
+
+            config = get_config()
+            assert get_config() is not config
+            config["FAIL_ON_WARNING"] = False
+            config.pop("DISABLED_RULES")
+            assert get_config()["FAIL_ON_WARNING"] is True
+            assert "DISABLED_RULES" in get_config()
+            assert get_fail_on_warning() is True
+
+            mock_settings.SAFE_MIGRATIONS = {"FAIL_ON_WARNING": False}
+            assert get_config()["FAIL_ON_WARNING"] is False
+
+    def test_get_config_can_be_copied_and_pickled(self):
+        """Test get_config returns a plain dict that copies and pickles."""
+        import copy
+        import pickle
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"DISABLED_RULES": ["SM001"]}
+            config = get_config()
+
+            assert type(config) is dict
+            assert copy.copy(config) == config
+            assert copy.deepcopy(config) == config
+            assert pickle.loads(pickle.dumps(config)) == config
+
+    def test_app_severity_overrides_parsed_once(self):
+        """Test per-app RULE_SEVERITY is parsed once, not per lookup."""
+        from django_safe_migrations import conf
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "RULE_SEVERITY": {"SM001": "warning"},
+                "APP_RULES": {"legacy": {"RULE_SEVERITY": {"SM001": "Info"}}},
+            }
+            get_rule_severity_for_app("SM001", Severity.ERROR, "legacy")
+
+            with patch.object(
+                conf, "_parse_severity_map", wraps=conf._parse_severity_map
+            ) as spy:
+                for _ in range(5):
+                    assert (
+                        get_rule_severity_for_app("SM001", Severity.ERROR, "legacy")
+                        == Severity.INFO
+                    )
+                    assert (
+                        get_rule_severity_for_app("SM001", Severity.ERROR, "other")
+                        == Severity.WARNING
+                    )
+
+            assert spy.call_count == 1  # global map for the unseen "other" app
+
+    def test_app_disabled_rules_follow_settings(self):
+        """Test per-app DISABLED_RULES sets are rebuilt for new settings."""
+        from django.test import override_settings
+
+        app_rules = {"legacy": {"DISABLED_RULES": ["SM001"]}}
+        with override_settings(SAFE_MIGRATIONS={"APP_RULES": app_rules}):
+            assert is_rule_enabled_for_app("SM001", "legacy") is False
+            assert is_rule_enabled_for_app("SM002", "legacy") is True
+
+        app_rules = {"legacy": {"DISABLED_RULES": ["SM002"]}}
+        with override_settings(SAFE_MIGRATIONS={"APP_RULES": app_rules}):
+            assert is_rule_enabled_for_app("SM001", "legacy") is True
+            assert is_rule_enabled_for_app("SM002", "legacy") is False
+
+    def test_app_policy_resolved_once(self):
+        """Test an app's APP_RULES entry is resolved once for many checks."""
+        from django_safe_migrations import conf
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "APP_RULES": {"critical": {"ENABLED_CATEGORIES": ["indexes"]}},
+            }
+            is_rule_enabled_for_app("SM010", "critical")
+
+            with patch.object(conf, "get_app_config", wraps=conf.get_app_config) as spy:
+                for _ in range(5):
+                    assert is_rule_enabled_for_app("SM010", "critical") is True
+                    assert is_rule_enabled_for_app("SM001", "critical") is False
+
+            assert spy.call_count == 0
+
+    def test_get_effective_rules_for_app(self):
+        """Test the batched lookup matches the per-rule helpers."""
+        from django_safe_migrations.conf import get_effective_rules_for_app
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "DISABLED_RULES": ["SM003"],
+                "APP_RULES": {
+                    "legacy": {
+                        "DISABLED_CATEGORIES": ["destructive"],
+                        "RULE_SEVERITY": {"SM001": "info"},
+                    }
+                },
+            }
+            rule_ids = ["SM001", "SM002", "SM003"]
+
+            enabled, overrides = get_effective_rules_for_app("legacy", rule_ids)
+
+            assert enabled == {
+                r for r in rule_ids if is_rule_enabled_for_app(r, "legacy")
+            }
+            assert "SM002" not in enabled  # destructive
+            assert overrides == {"SM001": Severity.INFO}
+
+    def test_global_enablement_decided_once_per_rule(self):
+        """Test app_label=None lookups reuse the memoized global decision."""
+        from django_safe_migrations import conf
+
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {
+                "DISABLED_RULES": ["SM001"],
+                "DISABLED_CATEGORIES": ["destructive"],
+            }
+            for rule_id in ("SM001", "SM002", "SM010"):
+                is_rule_enabled_for_app(rule_id, None)
+
+            with patch.object(
+                conf,
+                "is_rule_disabled_by_category",
+                wraps=conf.is_rule_disabled_by_category,
+            ) as spy:
+                for _ in range(5):
+                    assert is_rule_enabled_for_app("SM001", None) is False
+                    assert is_rule_enabled_for_app("SM002", None) is False
+                    assert is_rule_enabled_for_app("SM010", None) is True
+                    assert is_rule_enabled("SM010") is True
+
+            assert spy.call_count == 0
+
+    def test_disabled_reason_logged_once(self, caplog):
+        """Test repeated checks do not re-log why a rule is disabled."""
+        import logging
+
+        app_rules = {"legacy": {"DISABLED_CATEGORIES": ["destructive"]}}
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"APP_RULES": app_rules}
+
+            with caplog.at_level(logging.DEBUG, logger="django_safe_migrations"):
+                for _ in range(5):
+                    assert is_rule_enabled_for_app("SM002", "legacy") is False
+
+        assert caplog.text.count("in app DISABLED_CATEGORIES") == 1
+
+    def test_returned_lists_are_copies(self):
+        """Test callers mutating a result do not corrupt the cache."""
+        with patch("django_safe_migrations.conf.settings") as mock_settings:
+            mock_settings.SAFE_MIGRATIONS = {"RULE_SEVERITY": {"SM001": "info"}}
+
+            get_excluded_apps().append("mutated")
+            get_disabled_rules().append("SM001")
+            get_severity_overrides().clear()
+
+            assert "mutated" not in get_excluded_apps()
+            assert is_rule_disabled("SM001") is False
+            assert get_severity_overrides() == {"SM001": Severity.INFO}
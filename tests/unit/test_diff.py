@@ -15,9 +15,18 @@ from django_safe_migrations.diff import (
     get_changed_migration_files,
     get_committed_apps_and_migrations,
     get_committed_migration_files,
+    invalidate_diff_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_git_root():
+    """Resolve the git root afresh in every test (it is cached per cwd)."""
+    invalidate_diff_cache()
+    yield
+    invalidate_diff_cache()
+
+
 class TestFindGitRoot:
     """Tests for _find_git_root."""
 
@@ -65,6 +74,19 @@ class TestFindGitRoot:
 
         assert root == os.getcwd()
 
+    def test_cached_per_working_directory(self):
+        """Test git is asked for the root once per working directory."""
+        mock_result = MagicMock()
+        mock_result.stdout = "/home/user/project\n"
+
+        with patch(
+            "django_safe_migrations.diff.subprocess.run", return_value=mock_result
+        ) as mock_run:
+            assert _find_git_root() == "/home/user/project"
+            assert _find_git_root() == "/home/user/project"
+
+        assert mock_run.call_count == 1
+
 
 class TestGetChangedMigrationFiles:
     """Tests for get_changed_migration_files."""
@@ -210,6 +232,8 @@ class TestGetChangedMigrationFiles:
         # Check that the diff command used "develop" as the base ref
         diff_cmd = [c for c in calls if "diff" in c]
         assert any("develop" in cmd for cmd in diff_cmd)
+        # The git root is resolved once and reused for the diff and paths
+        assert sum("rev-parse" in c for c in calls) == 1
 
     def test_skips_nonexistent_files(self, tmp_path):
         """Test that files listed by git but missing from disk are skipped."""
@@ -230,6 +254,37 @@ class TestGetChangedMigrationFiles:
 
         assert files == []
 
+    def test_parses_mixed_output_in_one_pass(self, tmp_path):
+        """Test CRLF endings, blank lines and non-migrations in one output."""
+        for app in ("a", "b"):
+            app_dir = tmp_path / app / "migrations"
+            app_dir.mkdir(parents=True)
+            (app_dir / "0001_initial.py").write_text("# migration")
+
+        mock_diff_result = MagicMock()
+        mock_diff_result.stdout = (
+            "a/migrations/0001_initial.py\r\n"
+            "\n"
+            "a/models.py\n"
+            "b/migrations/0001_initial.py\n"
+            "b/migrations/README.md\n"
+        )
+        mock_root_result = MagicMock()
+        mock_root_result.stdout = str(tmp_path) + "\n"
+
+        def mock_run(cmd, **kwargs):
+            if "rev-parse" in cmd:
+                return mock_root_result
+            return mock_diff_result
+
+        with patch("django_safe_migrations.diff.subprocess.run", side_effect=mock_run):
+            files = get_changed_migration_files("main")
+
+        assert files == [
+            str(tmp_path / "a" / "migrations" / "0001_initial.py"),
+            str(tmp_path / "b" / "migrations" / "0001_initial.py"),
+        ]
+
     def test_handles_empty_git_output(self, tmp_path):
         """Test handling of empty git diff output."""
         mock_diff_result = MagicMock()
@@ -369,6 +424,33 @@ class TestGetChangedAppsAndMigrations:
         assert "0002_add_field" in migration_names
         assert "0003_remove_field" in migration_names
 
+    def test_resolves_each_app_directory_once(self):
+        """Test symlink resolution happens once per app, not per file."""
+        changed_files = [
+            "/project/myapp/migrations/0001_initial.py",
+            "/project/myapp/migrations/0002_add_field.py",
+            "/project/other/migrations/0001_initial.py",
+        ]
+
+        with (
+            patch(
+                "django_safe_migrations.diff.get_changed_migration_files",
+                return_value=changed_files,
+            ),
+            patch(
+                "django_safe_migrations.diff.django_apps.get_app_configs",
+                return_value=[],
+            ),
+            patch(
+                "django_safe_migrations.diff.os.path.realpath",
+                side_effect=lambda path: path,
+            ) as mock_realpath,
+        ):
+            result = get_changed_apps_and_migrations("main")
+
+        assert [app for app, _ in result] == ["myapp", "myapp", "other"]
+        assert mock_realpath.call_count == 2
+
 
 class TestGetCommittedMigrationFiles:
     """Tests for get_committed_migration_files (committed-range diff)."""
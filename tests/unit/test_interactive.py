@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import io
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -10,6 +11,15 @@ from django_safe_migrations.interactive import review_issues_interactively
 from django_safe_migrations.rules.base import Issue, Severity
 
 
+@pytest.fixture(autouse=True)
+def _line_input():
+    """Read choices with input() even when the tests run on a terminal."""
+    with patch(
+        "django_safe_migrations.interactive._stdin_is_terminal", return_value=False
+    ):
+        yield
+
+
 @pytest.fixture
 def sample_issues():
     """Create sample issues for interactive review tests."""
@@ -197,3 +207,87 @@ class TestReviewIssuesInteractively:
             result = review_issues_interactively([issue])
 
         assert result == []
+
+
+class TestIssueHeader:
+    """Tests for the per-issue summary block."""
+
+    def test_block_written_at_once(self, sample_issues):
+        """Test each issue's summary is a single stderr write."""
+        from django_safe_migrations.interactive import _write_issue_header
+
+        stderr = MagicMock()
+        with patch("django_safe_migrations.interactive.sys.stderr", stderr):
+            _write_issue_header(1, 3, sample_issues[0])
+
+        stderr.write.assert_called_once_with(
+            "[1/3] SM001 [ERROR]\n"
+            "  Migration: myapp.0002_add_email\n"
+            "  Location: myapp/migrations/0002_add_email.py:15\n"
+            "  Adding NOT NULL field without default\n"
+            "\n"
+        )
+
+    def test_optional_lines_omitted(self, capsys, sample_issues):
+        """Test the location line is left out when there is no file path."""
+        with patch("builtins.input", side_effect=["q"]):
+            review_issues_interactively(sample_issues[1:2])
+
+        err = capsys.readouterr().err
+        assert "  Migration: myapp.0003_remove_old\n  Dropping column\n\n" in err
+        assert "Location" not in err
+
+
+class TestSingleKeyInput:
+    """Tests for single-keypress choices on a terminal."""
+
+    @pytest.fixture
+    def terminal(self):
+        """Simulate a POSIX terminal whose keypresses are given per test."""
+        pytest.importorskip("termios")
+        stdin = MagicMock()
+        stdin.fileno.return_value = 0
+        with (
+            patch(
+                "django_safe_migrations.interactive._stdin_is_terminal",
+                return_value=True,
+            ),
+            patch("django_safe_migrations.interactive.sys.stdin", stdin),
+            patch("django_safe_migrations.interactive.sys.stdout", io.StringIO()),
+            patch("termios.tcgetattr", return_value=[]),
+            patch("termios.tcsetattr") as restore,
+            patch("tty.setcbreak"),
+        ):
+            yield stdin, restore
+
+    def test_reads_one_key_per_choice(self, terminal, sample_issues):
+        """Test each choice is a keypress and input() is never called."""
+        stdin, restore = terminal
+        stdin.read.side_effect = ["k", "S", "k"]
+
+        with patch("builtins.input") as mock_input:
+            result = review_issues_interactively(sample_issues)
+
+        mock_input.assert_not_called()
+        assert [issue.rule_id for issue in result] == ["SM001", "SM010"]
+        assert restore.call_count == 3  # terminal mode restored every time
+
+    def test_enter_after_choice_is_ignored(self, terminal, sample_issues, capsys):
+        """Test a habitual Enter after each key is not read as a choice."""
+        stdin, restore = terminal
+        stdin.read.side_effect = ["k", "\n", "s", "\r", "\n", "k"]
+
+        result = review_issues_interactively(sample_issues)
+
+        assert [issue.rule_id for issue in result] == ["SM001", "SM010"]
+        assert "Invalid choice" not in capsys.readouterr().err
+        assert restore.call_count == 3
+
+    def test_ctrl_d_keeps_remaining(self, terminal, sample_issues):
+        """Test Ctrl-D behaves like end of input."""
+        stdin, _ = terminal
+        stdin.read.side_effect = ["s", "\x04"]
+
+        result = review_issues_interactively(sample_issues)
+
+        assert [issue.rule_id for issue in result] == ["SM002", "SM010"]
@@ -1,7 +1,9 @@
 """Tests for reporters."""
 
+import io
 import json
 from io import StringIO
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -158,6 +160,113 @@ class TestJsonReporter:
         assert len(data["issues"]) == 0
 
 
+class TestConsoleReporterGrouping:
+    """Tests for ConsoleReporter severity grouping."""
+
+    def test_orders_by_severity_and_summarises(self, sample_issues):
+        """Test errors come before warnings and the summary counts both."""
+        reporter = ConsoleReporter(stream=StringIO(), use_color=False)
+        output = reporter.report(list(reversed(sample_issues)))
+
+        assert output.index("SM010") < output.index("SM001") < output.index("SM002")
+        assert "Summary: 2 error(s), 1 warning(s)" in output
+
+
+class TestConsoleReporterIssueFormat:
+    """Tests for the exact layout of a single console issue."""
+
+    def test_plain_layout(self, sample_issues):
+        """Test location, message, operation and suggestion lines."""
+        reporter = ConsoleReporter(
+            stream=StringIO(), use_color=False, use_unicode=False
+        )
+
+        assert reporter._format_issue(sample_issues[0]) == (
+            "X ERROR [SM001] myapp/migrations/0002_add_email.py:15\n"
+            "   Adding NOT NULL field 'email' without default\n"
+            "   Operation: AddField(user.email)\n"
+            "\n"
+            "   * Suggestion:\n"
+            "      Use nullable field first, then backfill"
+        )
+
+    def test_location_falls_back_to_app_and_migration(self, sample_issues):
+        """Test issues without a file path show app_label/migration_name."""
+        reporter = ConsoleReporter(
+            stream=StringIO(), use_color=False, use_unicode=False
+        )
+
+        first_line = reporter._format_issue(sample_issues[1]).split("\n")[0]
+        assert first_line == "! WARNING [SM002] myapp/0003_remove_old"
+
+    def test_colored_layout(self, sample_issues):
+        """Test each colored part is wrapped in its code and a reset."""
+        reporter = ConsoleReporter(stream=StringIO(), use_color=True, use_unicode=False)
+        colors = ConsoleReporter.COLORS
+
+        first_line = reporter._format_issue(sample_issues[2]).split("\n")[0]
+        assert first_line == (
+            f"{colors['red']}X ERROR{colors['reset']} "
+            f"{colors['cyan']}[SM010]{colors['reset']} "
+            f"{colors['gray']}myapp/migrations/0004_add_index.py:10{colors['reset']}"
+        )
+
+    def test_badges_follow_flag_changes(self, sample_issues):
+        """Test changing use_unicode after construction changes the badge."""
+        reporter = ConsoleReporter(
+            stream=StringIO(), use_color=False, use_unicode=False
+        )
+        assert reporter._format_issue(sample_issues[0]).startswith("X ERROR")
+
+        reporter.use_unicode = True
+        assert reporter._format_issue(sample_issues[0]).startswith("\u2716 ERROR")
+
+
+class TestConsoleReporterStreaming:
+    """Tests for ConsoleReporter.write_report."""
+
+    def test_matches_report_output(self, sample_issues):
+        """Test streamed output is identical to report()."""
+        expected = StringIO()
+        ConsoleReporter(stream=expected, use_color=False).report(sample_issues)
+        streamed = StringIO()
+        ConsoleReporter(stream=streamed, use_color=False).write_report(sample_issues)
+
+        assert streamed.getvalue() == expected.getvalue()
+
+    def test_matches_report_output_through_output_wrapper(self, sample_issues):
+        """Test Django's OutputWrapper does not add extra line endings."""
+        from django.core.management.base import OutputWrapper
+
+        expected = StringIO()
+        ConsoleReporter(stream=OutputWrapper(expected), use_color=False).report(
+            sample_issues
+        )
+        streamed = StringIO()
+        ConsoleReporter(stream=OutputWrapper(streamed), use_color=False).write_report(
+            sample_issues
+        )
+
+        assert streamed.getvalue() == expected.getvalue()
+
+    def test_streams_issue_blocks(self, sample_issues):
+        """Test issues are handed to the stream lazily, not joined first."""
+        stream = StringIO()
+        reporter = ConsoleReporter(stream=stream, use_color=False)
+        with patch.object(stream, "writelines", wraps=stream.writelines) as spy:
+            reporter.write_report(sample_issues)
+
+        (blocks,) = spy.call_args.args
+        assert not isinstance(blocks, (list, str))
+
+    def test_no_issues(self):
+        """Test the empty report is written once."""
+        stream = StringIO()
+        ConsoleReporter(stream=stream, use_color=False).write_report([])
+
+        assert "No migration issues found" in stream.getvalue()
+
+
 class TestGitHubReporter:
     """Tests for GitHubReporter."""
 
@@ -189,6 +298,13 @@ class TestGitHubReporter:
         assert "::group::" in output
         assert "::endgroup::" in output
 
+    def test_summary_counts(self, sample_issues):
+        """Test the failure summary counts errors and warnings."""
+        reporter = GitHubReporter(stream=StringIO())
+        output = reporter.report(sample_issues)
+
+        assert "2 error(s), 1 warning(s)" in output
+
 
 class TestConsoleReporterUnicode:
     """Tests for ConsoleReporter Unicode detection and fallbacks."""
@@ -240,6 +356,13 @@ class TestConsoleReporterUnicode:
 
         assert "* Suggestion:" in output
 
+    def test_detect_unicode_support_follows_stdout_encoding(self):
+        """Test detection reads the current sys.stdout encoding each time."""
+        with patch("sys.stdout", MagicMock(encoding="UTF-8")):
+            assert ConsoleReporter._detect_unicode_support() is True
+        with patch("sys.stdout", MagicMock(encoding="latin-1")):
+            assert ConsoleReporter._detect_unicode_support() is False
+
     def test_detect_unicode_support_returns_bool(self):
         """Test that _detect_unicode_support returns a boolean."""
         result = ConsoleReporter._detect_unicode_support()
@@ -399,6 +522,68 @@ class TestGitLabReporter:
         data = json.loads(output)
         assert isinstance(data, list)
 
+    @staticmethod
+    def _with_non_ascii(sample_issues):
+        """Return the sample issues plus one with non-ASCII text."""
+        return sample_issues + [
+            Issue(
+                rule_id="SM002",
+                severity=Severity.WARNING,
+                operation="RemoveField(café.näme)",
+                message="Dropping column 'näme' from 'café' — ß",
+                file_path="myapp/migrations/0004_remove_näme.py",
+                line_number=3,
+            )
+        ]
+
+    @staticmethod
+    def _ascii_stream():
+        """Return a text stream that can only encode ASCII."""
+        return io.TextIOWrapper(io.BytesIO(), encoding="ascii")
+
+    def test_stdlib_and_orjson_output_match(self, sample_issues):
+        """Test that the orjson fast path emits the same JSON as the stdlib."""
+        pytest.importorskip("orjson")
+        issues = self._with_non_ascii(sample_issues)
+        stdlib_stream = self._ascii_stream()
+        fast_stream = self._ascii_stream()
+
+        with patch("django_safe_migrations.reporters.gitlab._HAS_ORJSON", False):
+            GitLabReporter(stream=stdlib_stream).report(issues)
+        GitLabReporter(stream=fast_stream).report(issues)
+        stdlib_stream.flush()
+
+        stdlib_bytes = stdlib_stream.buffer.getvalue()
+        fast_bytes = fast_stream.buffer.getvalue()
+        assert "café".encode() in fast_bytes  # raw UTF-8 via the buffer
+        assert json.loads(fast_bytes) == json.loads(stdlib_bytes)
+
+    def test_ascii_stream_without_orjson(self, sample_issues):
+        """Test that the stdlib path escapes non-ASCII for any stream."""
+        issues = self._with_non_ascii(sample_issues)
+        stream = self._ascii_stream()
+
+        with patch("django_safe_migrations.reporters.gitlab._HAS_ORJSON", False):
+            output = GitLabReporter(stream=stream).report(issues)
+        stream.flush()
+
+        assert output.isascii()
+        assert json.loads(stream.buffer.getvalue())[-1]["description"].endswith("— ß")
+
+    def test_stream_without_buffer_uses_stdlib(self, sample_issues):
+        """Test that a stream with no binary buffer gets the escaped JSON."""
+        issues = self._with_non_ascii(sample_issues)
+        stream = StringIO()
+
+        output = GitLabReporter(stream=stream).report(issues)
+
+        assert output.isascii()
+        assert stream.getvalue() == output + "\n"
+
+    def test_empty_report_is_empty_list(self):
+        """Test that no issues serialise to an empty JSON array."""
+        assert GitLabReporter(stream=StringIO()).report([]) == "[]"
+
     def test_correct_number_of_entries(self, sample_issues):
         """Test that the number of entries matches the number of issues."""
         stream = StringIO()
@@ -510,6 +695,23 @@ class TestGitLabReporter:
         for e1, e2 in zip(data1, data2):
             assert e1["fingerprint"] == e2["fingerprint"]
 
+    def test_fingerprint_format(self, sample_issues):
+        """Test that fingerprints are 32-character BLAKE2b hex digests."""
+        import hashlib
+
+        issue = sample_issues[0]
+        entry = json.loads(GitLabReporter(stream=StringIO()).report([issue]))[0]
+        source = (
+            f"{issue.rule_id}:{issue.app_label}:{issue.migration_name}:"
+            f"{issue.operation}:{issue.line_number}:{issue.message}"
+        )
+
+        assert len(entry["fingerprint"]) == 32
+        assert (
+            entry["fingerprint"]
+            == hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+        )
+
     def test_fingerprints_are_unique(self, sample_issues):
         """Test that different issues produce different fingerprints."""
         stream = StringIO()
@@ -643,6 +845,18 @@ class TestGitHubPRReporter:
         assert "2 errors" in output
         assert "1 warning" in output
 
+    def test_summary_counts_every_severity(self, sample_issues):
+        """The summary line counts errors, warnings and info together."""
+        info = Issue(
+            rule_id="SM999",
+            severity=Severity.INFO,
+            operation="x",
+            message="note",
+        )
+        output = self._reporter(StringIO()).report([*sample_issues, info])
+
+        assert "Found **4 issues** — 2 errors, 1 warning, 1 info." in output
+
     def test_groups_by_file_with_tables(self, sample_issues):
         """Issues are grouped under per-file headers as Markdown tables."""
         output = self._reporter(StringIO()).report(sample_issues)
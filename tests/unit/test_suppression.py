@@ -121,6 +121,12 @@ class TestSuppression:
         assert suppression.suppresses("SM001") is True
         assert suppression.suppresses("SM999") is True
 
+    def test_uses_slots(self) -> None:
+        """Test Suppression instances carry no per-instance __dict__."""
+        suppression = Suppression(rules={"all"}, reason=None, line_number=1)
+
+        assert not hasattr(suppression, "__dict__")
+
 
 class TestGetSuppressionsFromFile:
     """Tests for get_suppressions_from_file function."""